@@ -1,10 +1,19 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
+    # defer_build skips core-schema construction at import time; the schema
+    # is built lazily on the first (cached) Settings() instantiation.
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        defer_build=True,
+    )
+
     # Application
     app_name: str = "Legal Reference Library API"
     debug: bool = False
@@ -12,6 +21,12 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str
     supabase_key: str
+    # Optional Supavisor pooled endpoint (port 6543); the direct database
+    # connection saturates at a few dozen clients on smaller tiers
+    supabase_db_pool_url: str = ""
+    # Optional direct Postgres DSN - enables the bulk COPY path for
+    # large embedding inserts
+    postgres_dsn: str = ""
 
     # External APIs
     google_api_key: str = ""
@@ -27,14 +42,18 @@ class Settings(BaseSettings):
     openai_api_key: str = ""
     gemini_api_key: str = ""
 
+    # Feature flags - disabled router groups are never imported
+    enable_search: bool = True
+    enable_documents: bool = True
+    enable_ai: bool = True
+
+    # Preflight HEAD before downloads when the request sets max_size;
+    # disable for servers that reject HEAD with 405
+    download_preflight_head: bool = True
+
     # CORS
     frontend_url: str = "http://localhost:3000"
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
-
 
 @lru_cache()
 def get_settings() -> Settings:
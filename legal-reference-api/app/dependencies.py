@@ -1,29 +1,73 @@
-from typing import Generator
-from supabase import create_client, Client
+from functools import lru_cache
+import httpx
+from fastapi import Request
+from supabase import create_client, Client, ClientOptions
 from app.config import get_settings
 
+# Connection-pool settings shared by the Supabase sub-clients. The httpx
+# defaults (10 keepalive connections) collapse under bursty traffic across
+# the mounted routers.
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_POOL_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
 
-def get_supabase() -> Generator[Client, None, None]:
+
+def _tune_session(sub_client) -> None:
+    """Swap a sub-client's httpx session for one with tuned pool limits."""
+    default_session = sub_client.session
+    sub_client.session = httpx.Client(
+        base_url=default_session.base_url,
+        headers=default_session.headers,
+        limits=_POOL_LIMITS,
+        timeout=_POOL_TIMEOUT,
+        follow_redirects=True,
+    )
+    default_session.close()
+
+
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Client:
     """
-    Dependency that provides a Supabase client.
+    Get the shared Supabase client singleton.
 
-    Usage in route:
-        @router.get("/")
-        async def get_items(supabase: Client = Depends(get_supabase)):
-            ...
+    Built once on first call (or during lifespan startup) so every request
+    reuses the same pooled HTTP session instead of paying connection setup
+    per request.
     """
     settings = get_settings()
-    client = create_client(settings.supabase_url, settings.supabase_key)
-    try:
-        yield client
-    finally:
-        # Supabase client doesn't need explicit cleanup
-        pass
+    # Prefer the Supavisor pooled endpoint when configured so spikes don't
+    # exhaust the direct database connection limit
+    supabase_url = settings.supabase_db_pool_url or settings.supabase_url
+    client = create_client(
+        supabase_url,
+        settings.supabase_key,
+        options=ClientOptions(postgrest_client_timeout=30),
+    )
+    _tune_session(client.postgrest)
+    _tune_session(client.storage)
+    return client
 
 
-def get_supabase_client() -> Client:
+def close_supabase_client() -> None:
+    """Close the pooled sessions on shutdown (no-op if never initialized)."""
+    if get_supabase_client.cache_info().currsize:
+        client = get_supabase_client()
+        client.postgrest.session.close()
+        client.storage.session.close()
+
+
+def get_supabase(request: Request) -> Client:
     """
-    Get Supabase client directly (for services).
+    Dependency that provides the shared Supabase client.
+
+    Reads the instance published on app.state by the lifespan handler,
+    falling back to the cached factory when lifespan hasn't run (tests).
+
+    Usage in route:
+        @router.get("/")
+        async def get_items(supabase: Client = Depends(get_supabase)):
+            ...
     """
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_key)
+    supabase = getattr(request.app.state, "supabase", None)
+    if supabase is None:
+        supabase = get_supabase_client()
+    return supabase
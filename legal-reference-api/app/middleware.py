@@ -0,0 +1,112 @@
+"""Pure-ASGI middleware - avoids Starlette's per-request middleware overhead."""
+
+
+class PrecomputedResponseMiddleware:
+    """
+    Serve fixed GET endpoints from pre-encoded JSON bytes.
+
+    Health probes hit "/" and "/health" constantly; answering them here
+    skips route matching, pydantic, and JSON serialization entirely.
+    """
+
+    def __init__(self, app, responses: dict[str, bytes]):
+        self.app = app
+        # Kept by reference so entries can be registered after startup
+        # (e.g. the OpenAPI schema, which only exists once routes are set up)
+        self.responses = responses
+        self._prepared: dict[str, tuple] = {}
+
+    def _prepare(self, path: str, body: bytes) -> tuple:
+        prepared = (
+            body,
+            [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+            ],
+        )
+        self._prepared[path] = prepared
+        return prepared
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "GET":
+            path = scope["path"]
+            cached = self._prepared.get(path)
+            if cached is None and path in self.responses:
+                cached = self._prepare(path, self.responses[path])
+            if cached is not None:
+                body, headers = cached
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": headers,
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self.app(scope, receive, send)
+
+
+class FastCORSMiddleware:
+    """
+    Minimal CORS middleware for a small, static origin allowlist.
+
+    Handles preflight requests and response header injection directly at
+    the ASGI layer, without the extra coroutine machinery of the stock
+    CORSMiddleware. Every request to this API goes through CORS, so this
+    is on the hot path.
+    """
+
+    # The API only serves these methods/headers; enumerating them beats
+    # echoing the request's wildcard expansion on every preflight
+    _PREFLIGHT_HEADERS = (
+        (b"access-control-allow-credentials", b"true"),
+        (b"access-control-allow-methods", b"GET, POST, PUT, PATCH, DELETE, OPTIONS"),
+        (b"access-control-allow-headers", b"authorization, content-type, x-request-id"),
+        (b"access-control-max-age", b"600"),
+        (b"vary", b"Origin"),
+    )
+
+    def __init__(self, app, origins):
+        self.app = app
+        self.allowed_origins = frozenset(
+            origin.encode("latin-1") for origin in origins
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+
+        # Non-CORS request or disallowed origin - pass through untouched
+        if origin is None or origin not in self.allowed_origins:
+            await self.app(scope, receive, send)
+            return
+
+        # Preflight - answer directly without entering the router
+        if scope["method"] == "OPTIONS" and b"access-control-request-method" in headers:
+            response_headers = [
+                (b"access-control-allow-origin", origin),
+                *self._PREFLIGHT_HEADERS,
+            ]
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": response_headers,
+            })
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        # Simple request - append CORS headers to the response
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"access-control-allow-origin", origin),
+                    (b"access-control-allow-credentials", b"true"),
+                    (b"vary", b"Origin"),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
@@ -1,5 +1,6 @@
 """Pydantic models for AI endpoints (chat, embeddings, cleaning)."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
 from typing import Optional, List, Literal
 from enum import Enum
 
@@ -28,22 +29,23 @@ class SummaryStyle(str, Enum):
 class ChatRequest(BaseModel):
     """Request for chat/Q&A/summarize operations."""
     message: Optional[str] = Field(None, description="User message (required for chat/qa)")
-    mode: ChatMode = Field(ChatMode.QA, description="Operation mode")
-    provider: ChatProvider = Field(ChatProvider.PGVECTOR, description="AI provider")
+    mode: Literal["chat", "qa", "summarize"] = Field("qa", description="Operation mode")
+    provider: Literal["pgvector", "gemini"] = Field("pgvector", description="AI provider")
     resource_ids: Optional[List[str]] = Field(None, description="Filter to specific resources")
     session_id: Optional[str] = Field(None, description="Chat session ID for history")
     model: Optional[str] = Field(None, description="Override default model")
     temperature: float = Field(0.7, ge=0, le=2, description="Sampling temperature")
-    summary_style: SummaryStyle = Field(SummaryStyle.DETAILED, description="Style for summaries")
+    summary_style: Literal["brief", "detailed", "bullet"] = Field("detailed", description="Style for summaries")
 
 
-class SourceChunk(BaseModel):
-    """Source chunk from vector search."""
+@dataclass(slots=True, frozen=True)
+class SourceChunk:
+    """Source chunk from vector search (slotted DTO - built in bulk)."""
     resource_id: str
-    title: Optional[str] = None
-    url: Optional[str] = None
     snippet: str
     similarity: float
+    title: Optional[str] = None
+    url: Optional[str] = None
 
 
 class ChatResponse(BaseModel):
@@ -137,8 +139,7 @@ class CleaningOptions(BaseModel):
     remove_duplicates: bool = Field(False, alias="removeDuplicates")
     normalize_markdown: bool = Field(True, alias="normalizeMarkdown")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class CleanRequest(BaseModel):
@@ -180,7 +181,7 @@ class AdvancedCleanMethod(str, Enum):
 
 class AdvancedCleanRequest(BaseModel):
     """Request for advanced cleaning."""
-    method: AdvancedCleanMethod = Field(..., description="Cleaning method")
+    method: Literal["jina", "llm", "readability"] = Field(..., description="Cleaning method")
     text: Optional[str] = Field(None, description="Text to clean (for llm, readability)")
     url: Optional[str] = Field(None, description="URL to clean (for jina)")
     html: Optional[str] = Field(None, description="HTML to clean (for readability)")
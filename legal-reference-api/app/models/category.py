@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 from datetime import datetime
 
@@ -12,8 +12,7 @@ class CategoryGroup(BaseModel):
     display_order: int = 0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryFolder(BaseModel):
@@ -26,8 +25,7 @@ class CategoryFolder(BaseModel):
     display_order: int = 0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Category(BaseModel):
@@ -41,8 +39,7 @@ class Category(BaseModel):
     display_order: int = 0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CategoryWithNested(Category):
@@ -1,8 +1,23 @@
 """Pydantic models for document processing endpoints."""
-from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, List
+import re
+from pydantic import AfterValidator, BaseModel, Field
+from pydantic.dataclasses import dataclass
+from typing import Annotated, Literal, Optional, List
 from enum import Enum
 
+_URL_RE = re.compile(r"^https?://\S+$")
+
+
+def _check_url(value: str) -> str:
+    """Cheap http/https sanity check - avoids the full HttpUrl/idna parse."""
+    if not _URL_RE.match(value):
+        raise ValueError("invalid url (must start with http:// or https://)")
+    return value
+
+
+# URL string validated once against the compiled regex above
+UrlStr = Annotated[str, AfterValidator(_check_url)]
+
 
 class DocumentType(str, Enum):
     """Supported document types for parsing."""
@@ -26,10 +41,16 @@ class StorageFolder(str, Enum):
 # Download Models
 class DownloadRequest(BaseModel):
     """Request to download a file from URL to Supabase storage."""
-    url: str = Field(..., description="URL of the file to download")
+    url: UrlStr = Field(..., description="URL of the file to download")
     filename: Optional[str] = Field(None, description="Custom filename (auto-generated if not provided)")
-    folder: StorageFolder = Field(StorageFolder.DOCUMENTS, description="Storage folder")
+    folder: Literal["documents", "videos", "thumbnails", "general"] = Field(
+        "documents", description="Storage folder"
+    )
     bucket: str = Field("reference-files", description="Supabase storage bucket")
+    max_size: Optional[int] = Field(
+        None, gt=0,
+        description="Reject files larger than this many bytes (checked via HEAD before downloading)"
+    )
 
 
 class DownloadResponse(BaseModel):
@@ -46,8 +67,8 @@ class DownloadResponse(BaseModel):
 # Parse Document Models
 class ParseDocumentRequest(BaseModel):
     """Request to parse a document from URL."""
-    url: str = Field(..., description="URL of the document to parse")
-    document_type: Optional[DocumentType] = Field(
+    url: UrlStr = Field(..., description="URL of the document to parse")
+    document_type: Optional[Literal["pdf", "docx", "doc", "txt", "md", "html", "rtf"]] = Field(
         None,
         description="Document type (auto-detected from URL if not provided)"
     )
@@ -67,7 +88,7 @@ class ParseDocumentResponse(BaseModel):
 # Scrape Models (Firecrawl)
 class ScrapeRequest(BaseModel):
     """Request to scrape a single URL using Firecrawl."""
-    url: str = Field(..., description="URL to scrape")
+    url: UrlStr = Field(..., description="URL to scrape")
     formats: List[str] = Field(
         default=["markdown", "html"],
         description="Output formats to return"
@@ -104,7 +125,7 @@ class ScrapeResponse(BaseModel):
 # Crawl Models (Firecrawl)
 class CrawlRequest(BaseModel):
     """Request to crawl a website using Firecrawl."""
-    url: str = Field(..., description="Starting URL to crawl")
+    url: UrlStr = Field(..., description="Starting URL to crawl")
     max_depth: int = Field(2, ge=1, le=10, description="Maximum crawl depth")
     limit: int = Field(10, ge=1, le=100, description="Maximum pages to crawl")
     formats: List[str] = Field(
@@ -135,8 +156,9 @@ class CrawlStatusResponse(BaseModel):
     error: Optional[str] = None
 
 
-class CrawledPage(BaseModel):
-    """Single page from crawl results."""
+@dataclass(slots=True, frozen=True)
+class CrawledPage:
+    """Single page from crawl results (slotted DTO - built in bulk)."""
     url: str
     title: Optional[str] = None
     markdown: Optional[str] = None
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.dataclasses import dataclass
+from typing import Literal, Optional, Any
 from datetime import datetime
 from enum import Enum
 
@@ -28,12 +29,12 @@ class ResourceCreate(BaseModel):
     url: str = Field(..., min_length=1)
     description: Optional[str] = None
     category_id: str
-    source_type: SourceType
+    source_type: Literal["website", "pdf", "video", "document", "article", "ebook"]
     file_url: Optional[str] = None
     file_size: Optional[int] = None
     thumbnail_url: Optional[str] = None
     content: Optional[str] = None
-    content_source: Optional[ContentSource] = None
+    content_source: Optional[Literal["scraped", "parsed", "manual"]] = None
     metadata: Optional[dict[str, Any]] = None
     is_public: bool = True
 
@@ -44,19 +45,20 @@ class ResourceUpdate(BaseModel):
     url: Optional[str] = None
     description: Optional[str] = None
     category_id: Optional[str] = None
-    source_type: Optional[SourceType] = None
+    source_type: Optional[Literal["website", "pdf", "video", "document", "article", "ebook"]] = None
     file_url: Optional[str] = None
     file_size: Optional[int] = None
     thumbnail_url: Optional[str] = None
     content: Optional[str] = None
-    content_source: Optional[ContentSource] = None
+    content_source: Optional[Literal["scraped", "parsed", "manual"]] = None
     metadata: Optional[dict[str, Any]] = None
     is_public: Optional[bool] = None
 
 
 # Response Models
-class CategoryBasic(BaseModel):
-    """Basic category info for embedding in resource responses."""
+@dataclass(slots=True, frozen=True)
+class CategoryBasic:
+    """Basic category info for embedding in resource responses (slotted DTO)."""
     id: str
     name: str
     slug: str
@@ -72,12 +74,12 @@ class ResourceResponse(BaseModel):
     url: str
     description: Optional[str] = None
     category_id: str
-    source_type: SourceType
+    source_type: Literal["website", "pdf", "video", "document", "article", "ebook"]
     file_url: Optional[str] = None
     file_size: Optional[int] = None
     thumbnail_url: Optional[str] = None
     content: Optional[str] = None
-    content_source: Optional[ContentSource] = None
+    content_source: Optional[Literal["scraped", "parsed", "manual"]] = None
     user_id: Optional[str] = None
     is_public: bool
     metadata: Optional[dict[str, Any]] = None
@@ -85,8 +87,7 @@ class ResourceResponse(BaseModel):
     updated_at: datetime
     category: Optional[CategoryBasic] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ResourceListResponse(BaseModel):
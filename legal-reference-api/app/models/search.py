@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any
 from enum import Enum
 
@@ -119,6 +119,10 @@ class SourceSearchResult(BaseModel):
 
 
 class CombinedSearchResponse(BaseModel):
+    # Constructed from a results dict keyed by source name; forbid extras so
+    # a typo'd source key fails loudly instead of being silently dropped
+    model_config = ConfigDict(extra="forbid")
+
     google: Optional[SourceSearchResult] = None
     youtube: Optional[SourceSearchResult] = None
     books: Optional[SourceSearchResult] = None
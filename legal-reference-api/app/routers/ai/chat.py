@@ -1,85 +1,154 @@
 """Chat endpoint - RAG-based Q&A, summarization, and chat."""
+import asyncio
+import hashlib
+import io
+import orjson
+
 from fastapi import APIRouter, Query
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import AsyncIterator, NamedTuple, Optional, List, Union
 
 from app.config import get_settings
 from app.models.ai import (
     ChatRequest,
     ChatResponse,
     ChatHistoryResponse,
-    ChatMode,
-    ChatProvider,
     SourceChunk,
 )
 from app.services.ai import (
     generate_embedding,
     chat_completion,
+    chat_completion_stream,
     gemini_chat_completion,
+    gemini_chat_completion_stream,
     chunk_text,
     build_rag_prompt,
     build_summarize_prompt,
 )
-from supabase import create_client
+from app.services.cache import TTLCache
+from app.services.supabase_async import AsyncSupabase, get_async_supabase
 
 router = APIRouter()
 
+# Repeat questions are common across sessions: cache query embeddings (an
+# OpenAI round-trip) and hydrated match results (a pgvector scan). Embeddings
+# are stable, so they keep a longer TTL than the match results, which go
+# stale as resources are added.
+_EMBEDDING_TTL = 3600.0
+_CHUNK_TTL = 300.0
+_embedding_cache = TTLCache(maxsize=1024)
+_chunk_cache = TTLCache(maxsize=512)
+
+# Summarize mode: resource content rarely changes between summarize calls,
+# so the chunk walk is memoized by content digest, and chunk collection
+# stops at a global character budget instead of 5 chunks per resource
+# (which over-feeds the LLM when many small docs are selected).
+_SUMMARY_CHUNK_BUDGET = 20 * 2000
+_summary_chunk_cache = TTLCache(maxsize=256)
+
+
+def _fast_chunks(content: str, size: int, overlap: int) -> List[str]:
+    """chunk_text memoized by a blake2b digest of the content."""
+    digest = hashlib.blake2b(
+        content.encode("utf-8"), digest_size=16
+    ).hexdigest()
+    key = f"{digest}:{size}:{overlap}"
+    chunks = _summary_chunk_cache.get(key)
+    if chunks is None:
+        chunks = chunk_text(content, size, overlap)
+        _summary_chunk_cache.set(key, chunks, 3600.0)
+    return chunks
+
+
+def _collect_summary_chunks(resources: List[dict]) -> List[dict]:
+    """Chunk resources for summarization under a global character budget."""
+    chunks: List[dict] = []
+    budget = _SUMMARY_CHUNK_BUDGET
+    for r in resources:
+        for text in _fast_chunks(r["content"], 2000, 100)[:5]:
+            chunks.append({"text": text, "source": r["title"]})
+            budget -= len(text)
+            if budget <= 0:
+                return chunks
+    return chunks
+
 
-def get_supabase():
-    """Get Supabase client."""
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_key)
+async def _cached_embedding(query: str) -> List[float]:
+    """Generate (or reuse) the embedding for a query, keyed on its text."""
+    key = hashlib.sha256(query.strip().lower().encode("utf-8")).hexdigest()
+    embedding = _embedding_cache.get(key)
+    if embedding is None:
+        embedding = await generate_embedding(query)
+        _embedding_cache.set(key, embedding, _EMBEDDING_TTL)
+    return embedding
 
 
 async def search_similar_chunks(
-    supabase,
+    supabase: AsyncSupabase,
     query: str,
     resource_ids: Optional[List[str]] = None,
     limit: int = 10,
     threshold: float = 0.5,
 ) -> List[dict]:
     """Search for similar chunks using pgvector."""
-    # Generate query embedding
-    query_embedding = await generate_embedding(query)
+    cache_key = hashlib.sha256(
+        f"{query}|{sorted(resource_ids or [])}|{threshold}|{limit}".encode("utf-8")
+    ).hexdigest()
+    cached = _chunk_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
 
-    # Call match_embeddings RPC function
-    result = supabase.rpc(
+    try:
+        chunks = await _search_similar_chunks_uncached(
+            supabase, query, resource_ids, limit, threshold
+        )
+    except Exception:
+        # Serve stale results rather than failing the chat when Supabase
+        # is briefly unavailable
+        stale = _chunk_cache.get(cache_key, allow_stale=True)
+        if stale is not None:
+            return list(stale)
+        raise
+
+    _chunk_cache.set(cache_key, chunks, _CHUNK_TTL)
+    return chunks
+
+
+async def _search_similar_chunks_uncached(
+    supabase: AsyncSupabase,
+    query: str,
+    resource_ids: Optional[List[str]],
+    limit: int,
+    threshold: float,
+) -> List[dict]:
+    query_embedding = await _cached_embedding(query)
+
+    # match_embeddings joins lr_resources server-side, so rows arrive with
+    # resource_title/resource_url already hydrated - no second round-trip
+    chunks = await supabase.rpc(
         "match_embeddings",
         {
             "query_embedding": query_embedding,
             "match_threshold": threshold,
             "match_count": limit,
             "filter_resource_ids": resource_ids,
-        }
-    ).execute()
-
-    chunks = result.data or []
-
-    # Get resource details
-    if chunks:
-        resource_ids_from_chunks = list(set(c["resource_id"] for c in chunks))
-
-        resources_result = supabase.table("lr_resources").select(
-            "id, title, url"
-        ).in_("id", resource_ids_from_chunks).execute()
-
-        resource_map = {r["id"]: r for r in (resources_result.data or [])}
-
-        for chunk in chunks:
-            resource = resource_map.get(chunk["resource_id"], {})
-            chunk["resource_title"] = resource.get("title")
-            chunk["resource_url"] = resource.get("url")
+        },
+    ) or []
 
     return chunks
 
 
 async def get_resource_content(
-    supabase,
+    supabase: AsyncSupabase,
     resource_ids: List[str]
 ) -> List[dict]:
     """Get full content for resources."""
-    result = supabase.table("lr_resources").select(
-        "id, title, content, description, url"
-    ).in_("id", resource_ids).execute()
+    # Clients sometimes send duplicate ids; dedupe before querying
+    resource_ids = list(dict.fromkeys(resource_ids))
+    rows = await supabase.select(
+        "lr_resources", "id, title, content, description, url",
+        in_=("id", resource_ids),
+    )
 
     return [
         {
@@ -88,160 +157,157 @@ async def get_resource_content(
             "content": r.get("content") or r.get("description") or "",
             "url": r["url"],
         }
-        for r in (result.data or [])
+        for r in rows
     ]
 
 
-@router.post("", response_model=ChatResponse)
-async def chat(request: ChatRequest):
-    """
-    Chat/Q&A/Summarize with RAG support.
+def _error(request: ChatRequest, message: str, model: str = "") -> ChatResponse:
+    """Build the standard failure response for this request."""
+    return ChatResponse(
+        success=False,
+        mode=request.mode,
+        provider=request.provider,
+        model=model,
+        error=message,
+    )
 
-    Modes:
-    - chat/qa: Answer questions using vector search for context
-    - summarize: Summarize specified resources
 
-    Providers:
-    - pgvector: Use OpenAI with vector search
-    - gemini: Use Google Gemini with full context
-    """
-    try:
-        settings = get_settings()
-        supabase = get_supabase()
+class _PreparedChat(NamedTuple):
+    """A chat request readied for completion: prompt built, sources resolved.
 
-        # Validate request
-        if request.mode != ChatMode.SUMMARIZE and not request.message:
-            return ChatResponse(
-                success=False,
-                mode=request.mode.value,
-                provider=request.provider.value,
-                model="",
-                error="Message is required for chat/qa modes"
+    Splitting preparation from completion lets the endpoint run the same
+    retrieval/prompt path for both the JSON response and the SSE stream.
+    """
+    prompt: str
+    context: Optional[str]
+    sources: List[SourceChunk]
+    model: str
+    provider: str
+
+
+async def _prepare_pgvector(
+    request: ChatRequest, supabase, settings
+) -> Union[ChatResponse, _PreparedChat]:
+    """Prepare chat/Q&A/summarize via OpenAI with pgvector RAG."""
+    if not settings.openai_api_key:
+        return _error(request, "OpenAI API key not configured")
+
+    model = request.model or "gpt-4o-mini"
+    sources: List[SourceChunk] = []
+
+    if request.mode == "summarize":
+        # Get content for summarization
+        resources = await get_resource_content(supabase, request.resource_ids or [])
+
+        if not resources:
+            return _error(
+                request, "No resources found or no content available", model
             )
 
-        if request.mode == ChatMode.SUMMARIZE and not request.resource_ids:
-            return ChatResponse(
-                success=False,
-                mode=request.mode.value,
-                provider=request.provider.value,
-                model="",
-                error="resource_ids required for summarize mode"
+        # Create chunks from resources
+        chunks = _collect_summary_chunks(resources)
+
+        prompt = build_summarize_prompt(chunks, request.summary_style)
+
+    else:
+        # Q&A or chat mode - use vector search
+        search_results = await search_similar_chunks(
+            supabase,
+            request.message or "",
+            request.resource_ids,
+            10,
+            0.5
+        )
+
+        # Fallback if no matches
+        if not search_results and request.resource_ids:
+            resources = await get_resource_content(supabase, request.resource_ids)
+            for r_idx, r in enumerate(resources):
+                chunks = chunk_text(r["content"], 1000, 100)[:3]
+                for idx, text in enumerate(chunks):
+                    search_results.append({
+                        "resource_id": r["id"],
+                        "chunk_index": idx,
+                        "chunk_text": text,
+                        "similarity": 0.5,
+                        "resource_title": r["title"],
+                        "resource_url": r["url"],
+                    })
+
+        # Build sources
+        sources = [
+            SourceChunk(
+                resource_id=s["resource_id"],
+                title=s.get("resource_title"),
+                url=s.get("resource_url"),
+                snippet=s["chunk_text"][:200] + "...",
+                similarity=s["similarity"],
             )
+            for s in search_results
+        ]
+
+        prompt = build_rag_prompt(
+            request.message or "",
+            [{"text": s["chunk_text"], "source": s.get("resource_title", "Unknown")}
+             for s in search_results]
+        )
 
-        response_text = ""
-        sources: List[SourceChunk] = []
-        model = request.model
-
-        # pgvector RAG approach
-        if request.provider == ChatProvider.PGVECTOR:
-            if not settings.openai_api_key:
-                return ChatResponse(
-                    success=False,
-                    mode=request.mode.value,
-                    provider=request.provider.value,
-                    model="",
-                    error="OpenAI API key not configured"
-                )
-
-            model = model or "gpt-4o-mini"
-
-            if request.mode == ChatMode.SUMMARIZE:
-                # Get content for summarization
-                resources = await get_resource_content(supabase, request.resource_ids or [])
-
-                if not resources:
-                    return ChatResponse(
-                        success=False,
-                        mode=request.mode.value,
-                        provider=request.provider.value,
-                        model=model,
-                        error="No resources found or no content available"
-                    )
-
-                # Create chunks from resources
-                chunks = []
-                for r in resources:
-                    text_chunks = chunk_text(r["content"], 2000, 100)
-                    for text in text_chunks[:5]:
-                        chunks.append({"text": text, "source": r["title"]})
-
-                prompt = build_summarize_prompt(chunks, request.summary_style.value)
-                response_text = await chat_completion(
-                    [{"role": "user", "content": prompt}],
-                    model=model,
-                    temperature=request.temperature
-                )
-
-            else:
-                # Q&A or chat mode - use vector search
-                search_results = await search_similar_chunks(
-                    supabase,
-                    request.message or "",
-                    request.resource_ids,
-                    10,
-                    0.5
-                )
-
-                # Fallback if no matches
-                if not search_results and request.resource_ids:
-                    resources = await get_resource_content(supabase, request.resource_ids)
-                    for r_idx, r in enumerate(resources):
-                        chunks = chunk_text(r["content"], 1000, 100)[:3]
-                        for idx, text in enumerate(chunks):
-                            search_results.append({
-                                "resource_id": r["id"],
-                                "chunk_index": idx,
-                                "chunk_text": text,
-                                "similarity": 0.5,
-                                "resource_title": r["title"],
-                                "resource_url": r["url"],
-                            })
-
-                # Build sources
-                sources = [
-                    SourceChunk(
-                        resource_id=s["resource_id"],
-                        title=s.get("resource_title"),
-                        url=s.get("resource_url"),
-                        snippet=s["chunk_text"][:200] + "...",
-                        similarity=s["similarity"],
-                    )
-                    for s in search_results
-                ]
-
-                prompt = build_rag_prompt(
-                    request.message or "",
-                    [{"text": s["chunk_text"], "source": s.get("resource_title", "Unknown")}
-                     for s in search_results]
-                )
-
-                response_text = await chat_completion(
-                    [{"role": "user", "content": prompt}],
-                    model=model,
-                    temperature=request.temperature
-                )
-
-        # Gemini approach
-        elif request.provider == ChatProvider.GEMINI:
-            if not settings.gemini_api_key:
-                return ChatResponse(
-                    success=False,
-                    mode=request.mode.value,
-                    provider=request.provider.value,
-                    model="",
-                    error="Gemini API key not configured"
-                )
-
-            model = model or "gemini-2.0-flash-exp"
-            resources = await get_resource_content(supabase, request.resource_ids or [])
-
-            if request.mode == ChatMode.SUMMARIZE:
-                context = "\n\n---\n\n".join([
-                    f"## {r['title']}\n\n{r['content']}"
-                    for r in resources
-                ])
-
-                prompt = f"""Summarize the following documents. Style: {request.summary_style.value}.
+    return _PreparedChat(
+        prompt=prompt,
+        context=None,
+        sources=sources,
+        model=model,
+        provider="pgvector",
+    )
+
+
+def _build_gemini_context(resources: List[dict], include_url: bool) -> str:
+    """Assemble the full-document context into one StringIO buffer.
+
+    Documents here can run to megabytes; writing pieces into a single
+    buffer avoids the per-resource f-string intermediates the old
+    join-over-comprehension allocated before the final concatenation.
+    """
+    buf = io.StringIO()
+    first = True
+    for r in resources:
+        if not first:
+            buf.write("\n\n---\n\n")
+        buf.write("## ")
+        buf.write(r["title"])
+        if include_url:
+            buf.write(" (")
+            buf.write(str(r["url"]))
+            buf.write(")")
+        buf.write("\n\n")
+        buf.write(r["content"])
+        first = False
+    return buf.getvalue()
+
+
+async def _prepare_gemini(
+    request: ChatRequest, supabase, settings
+) -> Union[ChatResponse, _PreparedChat]:
+    """Prepare chat/Q&A/summarize via Google Gemini with full context."""
+    if not settings.gemini_api_key:
+        return _error(request, "Gemini API key not configured")
+
+    model = request.model or "gemini-2.0-flash-exp"
+    sources: List[SourceChunk] = []
+    resources = await get_resource_content(supabase, request.resource_ids or [])
+
+    # Content-less resources would still add header bytes to the context
+    # and count against the token budget
+    resources = [r for r in resources if r["content"]]
+    if not resources:
+        return _error(
+            request, "No resources found or no content available", model
+        )
+
+    if request.mode == "summarize":
+        context = _build_gemini_context(resources, include_url=False)
+
+        prompt = f"""Summarize the following documents. Style: {request.summary_style}.
 
 {context}
 
@@ -250,16 +316,13 @@ Provide a comprehensive summary that:
 - Notes important dates, parties, and case citations
 - Organizes information logically"""
 
-                response_text = await gemini_chat_completion(prompt, model=model, temperature=request.temperature)
+        context = None
 
-            else:
-                # Q&A mode
-                context = "\n\n---\n\n".join([
-                    f"## {r['title']} ({r['url']})\n\n{r['content']}"
-                    for r in resources
-                ])
+    else:
+        # Q&A mode
+        context = _build_gemini_context(resources, include_url=True)
 
-                prompt = f"""You are a legal research assistant. Answer the following question based on the provided documents.
+        prompt = f"""You are a legal research assistant. Answer the following question based on the provided documents.
 
 Question: {request.message}
 
@@ -268,94 +331,238 @@ Instructions:
 - Cite document titles when referencing specific information
 - If the answer cannot be found in the documents, say so clearly"""
 
-                response_text = await gemini_chat_completion(prompt, context, model=model, temperature=request.temperature)
+        # Create pseudo-sources
+        sources = [
+            SourceChunk(
+                resource_id=r["id"],
+                title=r["title"],
+                url=r["url"],
+                snippet=r["content"][:200] + "...",
+                similarity=1.0,
+            )
+            for r in resources
+        ]
+
+    return _PreparedChat(
+        prompt=prompt,
+        context=context,
+        sources=sources,
+        model=model,
+        provider="gemini",
+    )
+
+
+# Provider dispatch table built once at import - providers are a closed
+# Literal set, so a dict lookup replaces the if/elif chain per request
+_PROVIDER_HANDLERS = {
+    "pgvector": _prepare_pgvector,
+    "gemini": _prepare_gemini,
+}
+
+
+async def _complete(prepared: _PreparedChat, temperature: float) -> str:
+    """Run the prepared prompt to completion, returning the full text."""
+    if prepared.provider == "pgvector":
+        return await chat_completion(
+            [{"role": "user", "content": prepared.prompt}],
+            model=prepared.model,
+            temperature=temperature,
+        )
+    return await gemini_chat_completion(
+        prepared.prompt, prepared.context,
+        model=prepared.model, temperature=temperature,
+    )
+
+
+def _complete_stream(
+    prepared: _PreparedChat, temperature: float
+) -> AsyncIterator[str]:
+    """Run the prepared prompt as a stream of text deltas."""
+    if prepared.provider == "pgvector":
+        return chat_completion_stream(
+            [{"role": "user", "content": prepared.prompt}],
+            model=prepared.model,
+            temperature=temperature,
+        )
+    return gemini_chat_completion_stream(
+        prepared.prompt, prepared.context,
+        model=prepared.model, temperature=temperature,
+    )
+
+
+async def _save_history(
+    supabase: AsyncSupabase,
+    request: ChatRequest,
+    response_text: Optional[str],
+    sources: List[SourceChunk],
+) -> None:
+    """Persist the user/assistant message pair in one batched insert."""
+    await supabase.insert("lr_chat_messages", [
+        {
+            "session_id": request.session_id,
+            "role": "user",
+            "content": request.message or "[Summarize request]",
+        },
+        {
+            "session_id": request.session_id,
+            "role": "assistant",
+            "content": response_text,
+            "sources": [
+                {
+                    "resource_id": s.resource_id,
+                    "title": s.title,
+                    "similarity": s.similarity,
+                }
+                for s in sources
+            ],
+        },
+    ])
+
+
+async def _event_stream(
+    request: ChatRequest, prepared: _PreparedChat, supabase: AsyncSupabase
+):
+    """Yield SSE frames: sources first, then text deltas, then done."""
+    yield b"data: " + orjson.dumps({
+        "type": "sources",
+        "model": prepared.model,
+        "sources": [
+            {
+                "resource_id": s.resource_id,
+                "title": s.title,
+                "url": s.url,
+                "snippet": s.snippet,
+                "similarity": s.similarity,
+            }
+            for s in prepared.sources
+        ],
+    }) + b"\n\n"
+
+    parts: List[str] = []
+    try:
+        async for delta in _complete_stream(prepared, request.temperature):
+            parts.append(delta)
+            yield b"data: " + orjson.dumps(
+                {"type": "delta", "content": delta}
+            ) + b"\n\n"
+    except Exception as e:
+        yield b"data: " + orjson.dumps(
+            {"type": "error", "error": f"Chat failed: {str(e)}"}
+        ) + b"\n\n"
+        return
+
+    if request.session_id:
+        await _save_history(supabase, request, "".join(parts), prepared.sources)
+
+    yield b"data: " + orjson.dumps({"type": "done"}) + b"\n\n"
+
+
+@router.post("", response_model=ChatResponse)
+async def chat(
+    request: ChatRequest,
+    stream: bool = Query(False, description="Stream the response as SSE frames"),
+):
+    """
+    Chat/Q&A/Summarize with RAG support.
+
+    Modes:
+    - chat/qa: Answer questions using vector search for context
+    - summarize: Summarize specified resources
+
+    Providers:
+    - pgvector: Use OpenAI with vector search
+    - gemini: Use Google Gemini with full context
+
+    With ?stream=true the response is a text/event-stream of sources,
+    delta, and done frames, so the first token arrives as soon as the
+    model produces it instead of after the full generation.
+    """
+    try:
+        settings = get_settings()
+        supabase = get_async_supabase()
+
+        # Validate request
+        if request.mode != "summarize" and not request.message:
+            return _error(request, "Message is required for chat/qa modes")
+
+        if request.mode == "summarize" and not request.resource_ids:
+            return _error(request, "resource_ids required for summarize mode")
+
+        # Literal validation guarantees the provider key exists
+        prepared = await _PROVIDER_HANDLERS[request.provider](
+            request, supabase, settings
+        )
+
+        # Preparation failures come back as ready-made error responses
+        if isinstance(prepared, ChatResponse):
+            return prepared
+
+        if stream:
+            return StreamingResponse(
+                _event_stream(request, prepared, supabase),
+                media_type="text/event-stream",
+            )
 
-                # Create pseudo-sources
-                sources = [
-                    SourceChunk(
-                        resource_id=r["id"],
-                        title=r["title"],
-                        url=r["url"],
-                        snippet=r["content"][:200] + "...",
-                        similarity=1.0,
-                    )
-                    for r in resources
-                ]
+        response_text = await _complete(prepared, request.temperature)
 
         # Save to chat history if session provided
         if request.session_id:
-            # Save user message
-            supabase.table("lr_chat_messages").insert({
-                "session_id": request.session_id,
-                "role": "user",
-                "content": request.message or "[Summarize request]",
-            }).execute()
-
-            # Save assistant response
-            supabase.table("lr_chat_messages").insert({
-                "session_id": request.session_id,
-                "role": "assistant",
-                "content": response_text,
-                "sources": [
-                    {
-                        "resource_id": s.resource_id,
-                        "title": s.title,
-                        "similarity": s.similarity,
-                    }
-                    for s in sources
-                ],
-            }).execute()
+            await _save_history(
+                supabase, request, response_text, prepared.sources
+            )
 
         return ChatResponse(
             success=True,
             response=response_text,
-            sources=sources,
-            mode=request.mode.value,
-            provider=request.provider.value,
-            model=model or "",
+            sources=prepared.sources,
+            mode=request.mode,
+            provider=request.provider,
+            model=prepared.model,
         )
 
     except Exception as e:
-        return ChatResponse(
-            success=False,
-            mode=request.mode.value if hasattr(request, 'mode') else "qa",
-            provider=request.provider.value if hasattr(request, 'provider') else "pgvector",
-            model="",
-            error=f"Chat failed: {str(e)}"
-        )
+        return _error(request, f"Chat failed: {str(e)}")
 
 
 @router.get("", response_model=ChatHistoryResponse)
 async def get_chat_history(session_id: Optional[str] = Query(None)):
     """Get chat sessions or messages for a specific session."""
     try:
-        supabase = get_supabase()
+        supabase = get_async_supabase()
 
         if session_id:
-            # Get specific session
-            session_result = supabase.table("lr_chat_sessions").select(
-                "*"
-            ).eq("id", session_id).single().execute()
-
-            messages_result = supabase.table("lr_chat_messages").select(
-                "*"
-            ).eq("session_id", session_id).order("created_at").execute()
-
-            return ChatHistoryResponse(
-                session=session_result.data if session_result.data else None,
-                messages=messages_result.data or [],
+            # The session row and its messages are independent queries -
+            # run them concurrently
+            session_rows, messages = await asyncio.gather(
+                supabase.select(
+                    "lr_chat_sessions", eq=("id", session_id), limit=1
+                ),
+                supabase.select(
+                    "lr_chat_messages",
+                    eq=("session_id", session_id),
+                    order="created_at",
+                ),
             )
 
-        # Get all sessions
-        sessions_result = supabase.table("lr_chat_sessions").select(
-            "*"
-        ).order("updated_at", desc=True).limit(50).execute()
+            # Rows are already JSON-shaped dicts from PostgREST; encode them
+            # with orjson directly instead of a dict -> pydantic -> json pass
+            return ORJSONResponse({
+                "session": session_rows[0] if session_rows else None,
+                "messages": messages,
+                "sessions": None,
+            })
 
-        return ChatHistoryResponse(
-            sessions=sessions_result.data or [],
-            messages=[],
+        # Get all sessions
+        sessions = await supabase.select(
+            "lr_chat_sessions", order="updated_at", desc=True, limit=50
         )
 
+        return ORJSONResponse({
+            "session": None,
+            "messages": [],
+            "sessions": sessions,
+        })
+
     except Exception as e:
         return ChatHistoryResponse(
             messages=[],
@@ -1,8 +1,9 @@
 """Clean endpoint - basic text cleaning for resources."""
-from fastapi import APIRouter, Query
+import asyncio
+
+from fastapi import APIRouter, Query, Request
 from typing import Optional
 
-from app.config import get_settings
 from app.models.ai import (
     CleanRequest,
     CleanResponse,
@@ -10,19 +11,45 @@ from app.models.ai import (
     CleaningOptions,
 )
 from app.services.ai import clean_content, get_cleaning_stats
-from supabase import create_client
+from app.services.supabase_async import get_async_supabase
+from types import MappingProxyType
 
 router = APIRouter()
 
-
-def get_supabase():
-    """Get Supabase client."""
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_key)
+# Conservative defaults for legal docs, built once at import. The proxy is
+# read-only, so it is passed to clean_content without a per-request copy.
+DEFAULT_OPTS = MappingProxyType({
+    "remove_html": True,
+    "remove_urls": False,  # URLs are often citations
+    "remove_boilerplate": False,
+    "normalize_whitespace": True,
+    "remove_short_lines": False,  # Too aggressive
+    "min_line_length": 10,
+    "remove_duplicates": False,  # Legal docs repeat phrases
+    "normalize_markdown": True,
+})
+
+# Below this size the process-pool round trip (pickle + IPC) costs more
+# than running the regexes inline
+_OFFLOAD_THRESHOLD = 20_000
+
+
+async def _run_clean(app, content: str, opts) -> str:
+    """Run clean_content, offloading large inputs to the process pool.
+
+    The regex passes are CPU-bound; for big documents they would otherwise
+    stall the event loop for every other in-flight request.
+    """
+    pool = getattr(app.state, "clean_pool", None)
+    if pool is None or len(content) < _OFFLOAD_THRESHOLD:
+        return clean_content(content, opts)
+    loop = asyncio.get_running_loop()
+    # dict() because a MappingProxyType doesn't pickle
+    return await loop.run_in_executor(pool, clean_content, content, dict(opts))
 
 
 @router.post("", response_model=CleanResponse)
-async def clean_text(request: CleanRequest):
+async def clean_text(request: CleanRequest, http_request: Request):
     """
     Preview or apply cleaning to text content.
 
@@ -36,19 +63,20 @@ async def clean_text(request: CleanRequest):
 
         # Fetch content from resource if ID provided
         if request.resource_id and not request.text:
-            supabase = get_supabase()
+            supabase = get_async_supabase()
 
-            resource_result = supabase.table("lr_resources").select(
-                "id, title, content, description"
-            ).eq("id", request.resource_id).single().execute()
+            resource_rows = await supabase.select(
+                "lr_resources", "id, title, content, description",
+                eq=("id", request.resource_id), limit=1,
+            )
 
-            if not resource_result.data:
+            if not resource_rows:
                 return CleanResponse(
                     success=False,
                     error="Resource not found"
                 )
 
-            resource = resource_result.data
+            resource = resource_rows[0]
             original_content = resource.get("content") or resource.get("description") or ""
             resource_title = resource.get("title", "")
 
@@ -58,31 +86,24 @@ async def clean_text(request: CleanRequest):
                 error="No content to clean"
             )
 
-        # Build cleaning options - conservative defaults for legal docs
+        # Build cleaning options
         if request.options:
             opts = request.options.model_dump(by_alias=False)
         else:
-            opts = {
-                "remove_html": True,
-                "remove_urls": False,  # URLs are often citations
-                "remove_boilerplate": False,
-                "normalize_whitespace": True,
-                "remove_short_lines": False,  # Too aggressive
-                "min_line_length": 10,
-                "remove_duplicates": False,  # Legal docs repeat phrases
-                "normalize_markdown": True,
-            }
+            opts = DEFAULT_OPTS
 
-        cleaned_content = clean_content(original_content, opts)
+        cleaned_content = await _run_clean(http_request.app, original_content, opts)
         stats = get_cleaning_stats(original_content, cleaned_content)
 
         # Apply changes if requested
         if request.apply and request.resource_id:
-            supabase = get_supabase()
+            supabase = get_async_supabase()
 
-            update_result = supabase.table("lr_resources").update({
-                "content": cleaned_content
-            }).eq("id", request.resource_id).execute()
+            await supabase.update(
+                "lr_resources",
+                {"content": cleaned_content},
+                eq=("id", request.resource_id),
+            )
 
             return CleanResponse(
                 success=True,
@@ -127,22 +148,23 @@ async def clean_text(request: CleanRequest):
 
 
 @router.get("")
-async def get_cleaning_preview(resource_id: str = Query(...)):
+async def get_cleaning_preview(http_request: Request, resource_id: str = Query(...)):
     """Get cleaning stats for a resource without modifying."""
     try:
-        supabase = get_supabase()
+        supabase = get_async_supabase()
 
-        resource_result = supabase.table("lr_resources").select(
-            "id, title, content, description"
-        ).eq("id", resource_id).single().execute()
+        resource_rows = await supabase.select(
+            "lr_resources", "id, title, content, description",
+            eq=("id", resource_id), limit=1,
+        )
 
-        if not resource_result.data:
+        if not resource_rows:
             return {
                 "success": False,
                 "error": "Resource not found"
             }
 
-        resource = resource_result.data
+        resource = resource_rows[0]
         original_content = resource.get("content") or resource.get("description") or ""
 
         if not original_content:
@@ -153,7 +175,9 @@ async def get_cleaning_preview(resource_id: str = Query(...)):
                 "stats": None,
             }
 
-        cleaned_content = clean_content(original_content)
+        cleaned_content = await _run_clean(
+            http_request.app, original_content, DEFAULT_OPTS
+        )
         stats = get_cleaning_stats(original_content, cleaned_content)
 
         return {
@@ -1,4 +1,9 @@
 """Embeddings endpoint - generate and manage vector embeddings."""
+import asyncio
+from collections import Counter
+
+import httpx
+
 from fastapi import APIRouter, Query
 from typing import Optional
 
@@ -11,20 +16,239 @@ from app.models.ai import (
 )
 from app.services.ai import (
     chunk_text,
-    count_tokens,
+    count_tokens_batch,
     clean_content,
     get_cleaning_stats,
     generate_embeddings,
 )
-from supabase import create_client
+from app.services import embeddings_store
+from app.services.supabase_async import get_async_supabase
+# Shared pooled singleton - creating a client per request re-initializes
+# the auth/PostgREST/storage sub-clients and their HTTP sessions
+from app.dependencies import get_supabase_client as get_supabase
 
 router = APIRouter()
 
+# Bound concurrent OpenAI embedding calls across resources and batches so
+# a large backfill doesn't trip the API's rate limits
+_EMBED_CONCURRENCY = asyncio.Semaphore(5)
 
-def get_supabase():
-    """Get Supabase client."""
-    settings = get_settings()
-    return create_client(settings.supabase_url, settings.supabase_key)
+
+async def _generate_embeddings_bounded(batch):
+    async with _EMBED_CONCURRENCY:
+        return await generate_embeddings(batch)
+
+
+# OpenAI embedding request caps: stay under the per-request token budget
+# and the documented 2048-inputs-per-request maximum
+_BATCH_TOKEN_LIMIT = 200_000
+_BATCH_ITEM_LIMIT = 2048
+
+
+def _token_batches(chunks, token_counts):
+    """Yield chunk batches sized by running token total, not item count.
+
+    Fixed-size batches overflow the API's token budget on long chunks and
+    waste per-request overhead on short ones; packing by tokens keeps
+    every request near the limit without tripping it.
+    """
+    batch, batch_tokens = [], 0
+    for chunk, tokens in zip(chunks, token_counts):
+        if batch and (
+            batch_tokens + tokens > _BATCH_TOKEN_LIMIT
+            or len(batch) == _BATCH_ITEM_LIMIT
+        ):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append(chunk)
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+async def _embed_batch(batch):
+    """Embed one batch, bisecting on a 400 (token-limit) rejection.
+
+    Token counts are heuristic, so a packed batch can still overshoot the
+    real tokenizer's budget; halving and retrying converges instead of
+    failing the whole resource.
+    """
+    try:
+        return await _generate_embeddings_bounded(batch)
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400 and len(batch) > 1:
+            mid = len(batch) // 2
+            return await _embed_batch(batch[:mid]) + await _embed_batch(batch[mid:])
+        raise
+
+
+# Above this many chunks, the vector text formatting is enough CPU to
+# move off the event-loop thread
+_FORMAT_OFFLOAD_THRESHOLD = 256
+
+
+def _build_embedding_records(resource_id, chunks, all_embeddings, token_counts, metadata):
+    """Build PostgREST insert records, formatting each vector as text.
+
+    map(repr, ...) keeps the float formatting loop in C; this is still
+    the dominant per-chunk cost on the non-COPY path, so large builds run
+    via asyncio.to_thread.
+    """
+    return [
+        {
+            "resource_id": resource_id,
+            "chunk_index": idx,
+            "chunk_text": chunk,
+            "embedding": "[" + ",".join(map(repr, all_embeddings[idx])) + "]",
+            "token_count": token_counts[idx],
+            "metadata": metadata,
+        }
+        for idx, chunk in enumerate(chunks)
+    ]
+
+
+async def _embed_one(
+    supabase,
+    request: EmbedRequest,
+    resource_id: str,
+    existing_chunks: dict,
+) -> EmbedResult:
+    """Embed a single resource; always returns a result, never raises.
+
+    Existence checks and force-deletes happen once for the whole batch in
+    the endpoint, so this only sees resources that still need work.
+    """
+    try:
+        if not request.force and resource_id in existing_chunks:
+            return EmbedResult(
+                resource_id=resource_id,
+                title="",
+                chunks=existing_chunks[resource_id],
+                status="skipped",
+            )
+
+        # Get resource content
+        resource_result = supabase.table("lr_resources").select(
+            "id, title, content, description, url"
+        ).eq("id", resource_id).single().execute()
+
+        if not resource_result.data:
+            return EmbedResult(
+                resource_id=resource_id,
+                title="",
+                chunks=0,
+                status="error",
+                error="Resource not found",
+            )
+
+        resource = resource_result.data
+        raw_content = resource.get("content") or resource.get("description") or ""
+
+        if not raw_content or len(raw_content) < 50:
+            return EmbedResult(
+                resource_id=resource_id,
+                title=resource.get("title", ""),
+                chunks=0,
+                status="error",
+                error="No content to embed (content too short or missing)",
+            )
+
+        # Clean content if requested
+        if request.clean_data:
+            text_content = clean_content(raw_content)
+            cleaning_stats = get_cleaning_stats(raw_content, text_content)
+        else:
+            text_content = raw_content
+            cleaning_stats = None
+
+        if not text_content or len(text_content) < 50:
+            return EmbedResult(
+                resource_id=resource_id,
+                title=resource.get("title", ""),
+                chunks=0,
+                status="error",
+                error="Content too short after cleaning",
+            )
+
+        # Chunk the text
+        chunks = chunk_text(text_content)
+
+        if not chunks:
+            return EmbedResult(
+                resource_id=resource_id,
+                title=resource.get("title", ""),
+                chunks=0,
+                status="error",
+                error="No chunks generated",
+            )
+
+        # Generate embeddings - batches packed by token budget, all in
+        # flight at once (bounded by the semaphore); gather preserves
+        # batch order. Token counts are reused for the insert below.
+        token_counts = count_tokens_batch(chunks)
+        batch_results = await asyncio.gather(*(
+            _embed_batch(batch)
+            for batch in _token_batches(chunks, token_counts)
+        ))
+        all_embeddings = [e for batch in batch_results for e in batch]
+
+        # Insert embeddings. Very large resources go through binary COPY
+        # when a direct DSN is configured - PostgREST inserts row-wise and
+        # the text path re-stringifies every vector; smaller inserts keep
+        # the single PostgREST round-trip.
+        # One dict shared by every record - PostgREST jsonb columns can't
+        # take pre-encoded JSON fragments, but the single shared object
+        # keeps allocation flat and lets orjson serialize it cheaply below
+        metadata = {
+            "source_title": resource.get("title"),
+            "source_url": resource.get("url"),
+        }
+        if (
+            embeddings_store.copy_enabled()
+            and len(chunks) >= embeddings_store.COPY_THRESHOLD
+        ):
+            # Rows are zipped lazily from the existing column lists
+            # (chunks / embeddings / token counts), so COPY streams
+            # straight from columnar data without materializing a
+            # row-tuple list first
+            rows = (
+                (resource_id, idx, chunk, embedding, tokens, metadata)
+                for idx, (chunk, embedding, tokens)
+                in enumerate(zip(chunks, all_embeddings, token_counts))
+            )
+            await asyncio.to_thread(embeddings_store.copy_embedding_rows, rows)
+        else:
+            if len(chunks) >= _FORMAT_OFFLOAD_THRESHOLD:
+                embedding_records = await asyncio.to_thread(
+                    _build_embedding_records,
+                    resource_id, chunks, all_embeddings, token_counts, metadata,
+                )
+            else:
+                embedding_records = _build_embedding_records(
+                    resource_id, chunks, all_embeddings, token_counts, metadata,
+                )
+
+            # The async PostgREST wrapper serializes the payload with
+            # orjson (one C-level dumps for all records) and doesn't block
+            # the event loop on a potentially multi-MB insert
+            await get_async_supabase().insert("lr_embeddings", embedding_records)
+
+        return EmbedResult(
+            resource_id=resource_id,
+            title=resource.get("title", ""),
+            chunks=len(chunks),
+            status="success",
+            cleaning_stats=cleaning_stats,
+        )
+
+    except Exception as e:
+        return EmbedResult(
+            resource_id=resource_id,
+            title="",
+            chunks=0,
+            status="error",
+            error=str(e),
+        )
 
 
 @router.post("", response_model=EmbedResponse)
@@ -62,139 +286,34 @@ async def generate_resource_embeddings(request: EmbedRequest):
 
     supabase = get_supabase()
     ids = request.resource_ids or [request.resource_id]
-    results = []
-
-    for resource_id in ids:
-        try:
-            # Check if embeddings already exist
-            if not request.force:
-                count_result = supabase.table("lr_embeddings").select(
-                    "id", count="exact"
-                ).eq("resource_id", resource_id).execute()
-
-                if count_result.count and count_result.count > 0:
-                    results.append(EmbedResult(
-                        resource_id=resource_id,
-                        title="",
-                        chunks=count_result.count,
-                        status="skipped",
-                    ))
-                    continue
-
-            # Get resource content
-            resource_result = supabase.table("lr_resources").select(
-                "id, title, content, description, url"
-            ).eq("id", resource_id).single().execute()
-
-            if not resource_result.data:
-                results.append(EmbedResult(
-                    resource_id=resource_id,
-                    title="",
-                    chunks=0,
-                    status="error",
-                    error="Resource not found",
-                ))
-                continue
-
-            resource = resource_result.data
-            raw_content = resource.get("content") or resource.get("description") or ""
-
-            if not raw_content or len(raw_content) < 50:
-                results.append(EmbedResult(
-                    resource_id=resource_id,
-                    title=resource.get("title", ""),
-                    chunks=0,
-                    status="error",
-                    error="No content to embed (content too short or missing)",
-                ))
-                continue
-
-            # Clean content if requested
-            if request.clean_data:
-                text_content = clean_content(raw_content)
-                cleaning_stats = get_cleaning_stats(raw_content, text_content)
-            else:
-                text_content = raw_content
-                cleaning_stats = None
-
-            if not text_content or len(text_content) < 50:
-                results.append(EmbedResult(
-                    resource_id=resource_id,
-                    title=resource.get("title", ""),
-                    chunks=0,
-                    status="error",
-                    error="Content too short after cleaning",
-                ))
-                continue
-
-            # Delete existing embeddings if force
-            if request.force:
-                supabase.table("lr_embeddings").delete().eq(
-                    "resource_id", resource_id
-                ).execute()
-
-            # Chunk the text
-            chunks = chunk_text(text_content)
-
-            if not chunks:
-                results.append(EmbedResult(
-                    resource_id=resource_id,
-                    title=resource.get("title", ""),
-                    chunks=0,
-                    status="error",
-                    error="No chunks generated",
-                ))
-                continue
-
-            # Generate embeddings in batches
-            batch_size = 100
-            all_embeddings = []
-
-            for i in range(0, len(chunks), batch_size):
-                batch = chunks[i:i + batch_size]
-                embeddings = await generate_embeddings(batch)
-                all_embeddings.extend(embeddings)
-
-            # Insert embeddings
-            embedding_records = [
-                {
-                    "resource_id": resource_id,
-                    "chunk_index": idx,
-                    "chunk_text": chunk,
-                    "embedding": f"[{','.join(str(x) for x in all_embeddings[idx])}]",
-                    "token_count": count_tokens(chunk),
-                    "metadata": {
-                        "source_title": resource.get("title"),
-                        "source_url": resource.get("url"),
-                    },
-                }
-                for idx, chunk in enumerate(chunks)
-            ]
 
-            insert_result = supabase.table("lr_embeddings").insert(
-                embedding_records
-            ).execute()
-
-            results.append(EmbedResult(
-                resource_id=resource_id,
-                title=resource.get("title", ""),
-                chunks=len(chunks),
-                status="success",
-                cleaning_stats=cleaning_stats,
-            ))
-
-        except Exception as e:
-            results.append(EmbedResult(
-                resource_id=resource_id,
-                title="",
-                chunks=0,
-                status="error",
-                error=str(e),
-            ))
-
-    successful = len([r for r in results if r.status == "success"])
-    skipped = len([r for r in results if r.status == "skipped"])
-    errors = len([r for r in results if r.status == "error"])
+    # One round-trip covers all per-resource probes: either a single
+    # existence query (to skip already-embedded resources) or a single
+    # batched delete when force re-embedding
+    existing_chunks: dict = {}
+    if request.force:
+        supabase.table("lr_embeddings").delete().in_(
+            "resource_id", ids
+        ).execute()
+    else:
+        existing_result = supabase.table("lr_embeddings").select(
+            "resource_id"
+        ).in_("resource_id", ids).execute()
+        for row in (existing_result.data or []):
+            rid = row["resource_id"]
+            existing_chunks[rid] = existing_chunks.get(rid, 0) + 1
+
+    # Embed resources concurrently - the work is dominated by OpenAI
+    # round-trips, and the semaphore caps total calls in flight. gather
+    # returns results in input order.
+    results = list(await asyncio.gather(*(
+        _embed_one(supabase, request, resource_id, existing_chunks)
+        for resource_id in ids
+    )))
+
+    # One pass over results instead of three throwaway comprehensions
+    counts = Counter(r.status for r in results)
+    successful, skipped, errors = counts["success"], counts["skipped"], counts["error"]
 
     return EmbedResponse(
         success=True,
@@ -246,9 +365,11 @@ async def get_embedding_status(
 
             resource_ids = [r["id"] for r in resources]
 
-            embeddings_result = supabase.table("lr_embeddings").select(
-                "resource_id"
-            ).in_("resource_id", resource_ids).execute()
+            # DB dedups to one row per embedded resource instead of
+            # shipping every chunk row back
+            embeddings_result = supabase.rpc(
+                "lr_embedded_resource_ids", {"ids": resource_ids}
+            ).execute()
 
             embedded_ids = set(e["resource_id"] for e in (embeddings_result.data or []))
 
@@ -266,20 +387,14 @@ async def get_embedding_status(
                 ],
             }
 
-        # General stats
-        total_result = supabase.table("lr_embeddings").select(
-            "id", count="exact"
-        ).execute()
-
-        resources_result = supabase.table("lr_embeddings").select(
-            "resource_id"
-        ).execute()
-
-        unique_resources = set(e["resource_id"] for e in (resources_result.data or []))
+        # General stats - one aggregate row from Postgres instead of
+        # fetching every embedding row to dedupe in Python
+        stats_result = supabase.rpc("lr_embedding_stats", {}).execute()
+        stats = (stats_result.data or [{}])[0]
 
         return {
-            "total_embeddings": total_result.count or 0,
-            "embedded_resources": len(unique_resources),
+            "total_embeddings": stats.get("total_embeddings") or 0,
+            "embedded_resources": stats.get("embedded_resources") or 0,
             "configured": bool(settings.openai_api_key),
         }
 
@@ -1,15 +1,14 @@
+from collections import defaultdict
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from supabase import Client
 from typing import Optional
 
 from app.dependencies import get_supabase
 from app.models.category import (
-    Category,
     CategoryWithNested,
     CategoryListResponse,
     CategoryHierarchyResponse,
-    GroupWithFolders,
-    FolderWithCategories,
 )
 
 router = APIRouter()
@@ -25,32 +24,30 @@ async def list_categories(
     List categories with optional filters.
     """
     try:
-        # Build query with relations
+        # Build query with relations. Slug filters are applied server-side
+        # through the embedded resources (!inner makes the embed an INNER
+        # JOIN so the filter actually restricts the rows) - only matching
+        # categories come over the wire.
+        group_select = "group:lr_groups!inner(*)" if group else "group:lr_groups(*)"
+        folder_select = "folder:lr_folders!inner(*)" if folder else "folder:lr_folders(*)"
         query_builder = supabase.table("lr_categories").select(
-            "*, group:lr_groups(*), folder:lr_folders(*)"
+            f"*, {group_select}, {folder_select}"
         )
 
+        if group:
+            query_builder = query_builder.eq("group.slug", group)
+        if folder:
+            query_builder = query_builder.eq("folder.slug", folder)
+
         # Order by display_order
         query_builder = query_builder.order("display_order", desc=False)
 
         result = query_builder.execute()
 
-        categories = result.data
-
-        # Filter by group/folder slug if provided
-        if group:
-            categories = [
-                c for c in categories
-                if c.get("group") and c["group"].get("slug") == group
-            ]
-
-        if folder:
-            categories = [
-                c for c in categories
-                if c.get("folder") and c["folder"].get("slug") == folder
-            ]
-
-        return CategoryListResponse(categories=categories)
+        # Supabase rows are already shaped for the response model; return
+        # them raw and let FastAPI's response serialization do the single
+        # validation pass instead of validating per-row here first
+        return {"categories": result.data}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -83,42 +80,42 @@ async def get_category_hierarchy(
         folders_data = folders_result.data or []
         categories_data = categories_result.data or []
 
+        # Bucket folders and categories by parent up front so the hierarchy
+        # build is a single pass per table instead of rescanning every list
+        # for every group/folder
+        folders_by_group = defaultdict(list)
+        for folder in folders_data:
+            folders_by_group[folder.get("group_id")].append(folder)
+
+        cats_by_folder = defaultdict(list)
+        direct_cats_by_group = defaultdict(list)
+        for cat in categories_data:
+            if cat.get("folder_id"):
+                cats_by_folder[cat["folder_id"]].append(cat)
+            else:
+                direct_cats_by_group[cat.get("group_id")].append(cat)
+
         # Build hierarchy
         hierarchy = []
 
         for group in groups_data:
             group_id = group["id"]
 
-            # Get folders for this group
+            # Nest raw dicts; the response model validates the whole tree
+            # once on serialization, so building Category/Folder models
+            # here would just validate every row twice
             group_folders = [
-                FolderWithCategories(
-                    **folder,
-                    categories=[
-                        Category(**cat)
-                        for cat in categories_data
-                        if cat.get("folder_id") == folder["id"]
-                    ]
-                )
-                for folder in folders_data
-                if folder.get("group_id") == group_id
-            ]
-
-            # Get direct categories (no folder)
-            direct_categories = [
-                Category(**cat)
-                for cat in categories_data
-                if cat.get("group_id") == group_id and not cat.get("folder_id")
+                {**folder, "categories": cats_by_folder[folder["id"]]}
+                for folder in folders_by_group[group_id]
             ]
 
-            hierarchy.append(
-                GroupWithFolders(
-                    **group,
-                    folders=group_folders,
-                    categories=direct_categories,
-                )
-            )
+            hierarchy.append({
+                **group,
+                "folders": group_folders,
+                "categories": direct_cats_by_group[group_id],
+            })
 
-        return CategoryHierarchyResponse(groups=hierarchy)
+        return {"groups": hierarchy}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,9 +1,14 @@
 """Crawl endpoint - multi-page website crawling using Firecrawl."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from itertools import islice
+from typing import Iterable, Optional
 import httpx
 import asyncio
+import orjson
+import time
 
 from app.config import get_settings
+from app.dependencies import get_supabase_client
 from app.models.document import (
     CrawlRequest,
     CrawlStatusResponse,
@@ -15,9 +20,62 @@ router = APIRouter()
 
 FIRECRAWL_API_URL = "https://api.firecrawl.dev/v1"
 
+# Crawl results larger than this are parsed in a worker thread so a
+# multi-thousand-page result doesn't stall the event loop
+_PARSE_OFFLOAD_THRESHOLD = 500
+
+
+def _parse_pages(raw: list) -> list:
+    """Build CrawledPage objects from raw Firecrawl page dicts."""
+    return [
+        CrawledPage(
+            url=(page.get("metadata") or {}).get("sourceURL", ""),
+            title=(page.get("metadata") or {}).get("title"),
+            markdown=page.get("markdown"),
+            html=page.get("html"),
+            metadata=page.get("metadata"),
+        )
+        for page in raw
+    ]
+
+
+def persist_pages(
+    pages: Iterable[CrawledPage],
+    category_id: Optional[str] = None,
+    batch_size: int = 500,
+) -> int:
+    """Persist crawled pages to lr_resources with batched inserts.
+
+    One insert per batch_size pages instead of a round-trip per page; the
+    batched-ingestion gains flatten out past ~1000 rows per statement on
+    Postgres, so the default stays below that. Returns the number of rows
+    inserted.
+    """
+    supabase = get_supabase_client()
+    it = iter(pages)
+    inserted = 0
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            break
+        supabase.table("lr_resources").insert([
+            {
+                "title": p.title or p.url,
+                "url": p.url,
+                "content": p.markdown,
+                "source_type": "website",
+                "content_source": "scraped",
+                "category_id": category_id,
+                "metadata": p.metadata or {},
+            }
+            for p in batch
+        ]).execute()
+        inserted += len(batch)
+    return inserted
+
 
 @router.post("", response_model=CrawlStatusResponse)
-async def start_crawl(request: CrawlRequest):
+async def start_crawl(request: CrawlRequest, http_request: Request):
     """
     Start a crawl job for a website.
 
@@ -49,19 +107,20 @@ async def start_crawl(request: CrawlRequest):
         if request.exclude_paths:
             payload["excludePaths"] = request.exclude_paths
 
-        # Start crawl job
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{FIRECRAWL_API_URL}/crawl",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {settings.firecrawl_api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-            response.raise_for_status()
+        # Start crawl job on the shared pooled client - no per-request
+        # TCP/TLS handshake against firecrawl.dev
+        client = http_request.app.state.http
+        response = await client.post(
+            f"{FIRECRAWL_API_URL}/crawl",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {settings.firecrawl_api_key}",
+                "Content-Type": "application/json",
+            }
+        )
+        response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         if not data.get("success"):
             return CrawlStatusResponse(
@@ -95,7 +154,7 @@ async def start_crawl(request: CrawlRequest):
 
 
 @router.get("/{job_id}", response_model=CrawlResponse)
-async def get_crawl_status(job_id: str):
+async def get_crawl_status(job_id: str, http_request: Request):
     """
     Get the status and results of a crawl job.
 
@@ -112,27 +171,25 @@ async def get_crawl_status(job_id: str):
         )
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{FIRECRAWL_API_URL}/crawl/{job_id}",
-                headers={
-                    "Authorization": f"Bearer {settings.firecrawl_api_key}",
-                }
-            )
-            response.raise_for_status()
+        client = http_request.app.state.http
+        response = await client.get(
+            f"{FIRECRAWL_API_URL}/crawl/{job_id}",
+            headers={
+                "Authorization": f"Bearer {settings.firecrawl_api_key}",
+            }
+        )
+        response.raise_for_status()
 
-        data = response.json()
+        # Crawl results can span many pages; orjson parses the raw bytes
+        # directly without the UTF-8 decode pass .json() would do
+        data = orjson.loads(response.content)
 
-        # Parse pages
-        pages = []
-        for page_data in data.get("data", []):
-            pages.append(CrawledPage(
-                url=page_data.get("metadata", {}).get("sourceURL", ""),
-                title=page_data.get("metadata", {}).get("title"),
-                markdown=page_data.get("markdown"),
-                html=page_data.get("html"),
-                metadata=page_data.get("metadata"),
-            ))
+        # Parse pages - large results move off the event-loop thread
+        raw_pages = data.get("data", [])
+        if len(raw_pages) > _PARSE_OFFLOAD_THRESHOLD:
+            pages = await asyncio.to_thread(_parse_pages, raw_pages)
+        else:
+            pages = _parse_pages(raw_pages)
 
         return CrawlResponse(
             success=True,
@@ -157,7 +214,7 @@ async def get_crawl_status(job_id: str):
 
 
 @router.delete("/{job_id}")
-async def cancel_crawl(job_id: str):
+async def cancel_crawl(job_id: str, http_request: Request):
     """Cancel a running crawl job."""
     settings = get_settings()
 
@@ -168,14 +225,14 @@ async def cancel_crawl(job_id: str):
         )
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.delete(
-                f"{FIRECRAWL_API_URL}/crawl/{job_id}",
-                headers={
-                    "Authorization": f"Bearer {settings.firecrawl_api_key}",
-                }
-            )
-            response.raise_for_status()
+        client = http_request.app.state.http
+        response = await client.delete(
+            f"{FIRECRAWL_API_URL}/crawl/{job_id}",
+            headers={
+                "Authorization": f"Bearer {settings.firecrawl_api_key}",
+            }
+        )
+        response.raise_for_status()
 
         return {"success": True, "message": f"Crawl job {job_id} cancelled"}
 
@@ -187,7 +244,11 @@ async def cancel_crawl(job_id: str):
 
 
 @router.post("/sync", response_model=CrawlResponse)
-async def crawl_sync(request: CrawlRequest, timeout_seconds: int = 120):
+async def crawl_sync(
+    request: CrawlRequest,
+    http_request: Request,
+    timeout_seconds: int = 120,
+):
     """
     Start a crawl and wait for results (synchronous version).
 
@@ -195,7 +256,7 @@ async def crawl_sync(request: CrawlRequest, timeout_seconds: int = 120):
     Useful for smaller crawls where you want immediate results.
     """
     # Start the crawl
-    start_result = await start_crawl(request)
+    start_result = await start_crawl(request, http_request)
 
     if not start_result.success or not start_result.job_id:
         return CrawlResponse(
@@ -206,19 +267,32 @@ async def crawl_sync(request: CrawlRequest, timeout_seconds: int = 120):
 
     job_id = start_result.job_id
 
-    # Poll for results
-    poll_interval = 2  # seconds
-    max_polls = timeout_seconds // poll_interval
+    # Poll with exponential backoff: start fast so small crawls return
+    # almost immediately, back off toward 8s so long crawls don't hammer
+    # the status endpoint. Backoff resets whenever the reported status
+    # changes (the job is making visible progress).
+    poll_interval = 0.5
+    last_status = None
+    deadline = time.monotonic() + timeout_seconds
 
-    for _ in range(max_polls):
-        await asyncio.sleep(poll_interval)
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        await asyncio.sleep(min(poll_interval, remaining))
 
-        result = await get_crawl_status(job_id)
+        result = await get_crawl_status(job_id, http_request)
 
         if result.status in ["completed", "failed", "error"]:
             return result
 
+        if result.status != last_status:
+            last_status = result.status
+            poll_interval = 0.5
+        else:
+            poll_interval = min(poll_interval * 1.5, 8.0)
+
     # Timeout - return partial results
-    final_result = await get_crawl_status(job_id)
+    final_result = await get_crawl_status(job_id, http_request)
     final_result.error = f"Timeout after {timeout_seconds}s - partial results returned"
     return final_result
@@ -1,10 +1,21 @@
 """Download endpoint - downloads files from URL to Supabase storage."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from functools import lru_cache
+from typing import Optional
+import asyncio
+import hashlib
 import httpx
+import re
+import tempfile
 import uuid
-from urllib.parse import urlparse, unquote
+from urllib.parse import unquote
 import mimetypes
 
+# Files under this size stay in memory; larger ones spill to disk so a
+# big PDF/video download doesn't hold the whole payload in RSS
+_SPOOL_MAX_BYTES = 8 << 20
+_DOWNLOAD_CHUNK_BYTES = 1 << 20
+
 from app.config import get_settings
 from app.models.document import DownloadRequest, DownloadResponse
 from supabase import create_client
@@ -18,21 +29,29 @@ def get_supabase_client():
     return create_client(settings.supabase_url, settings.supabase_key)
 
 
+# Last path segment containing a dot, ending at query/fragment/end of URL.
+# The lookbehind keeps the "//host" part of a bare-domain URL from matching
+# as a filename. Compiled once so the hot download path skips building a
+# ParseResult per call.
+_FILENAME_RE = re.compile(r"(?<!/)/([^/?#]+\.[^/?#]+)(?:[?#]|$)")
+
+
 def extract_filename_from_url(url: str) -> str:
     """Extract filename from URL or generate a unique one."""
-    parsed = urlparse(url)
-    path = unquote(parsed.path)
-
-    # Get filename from path
-    if "/" in path:
-        filename = path.split("/")[-1]
-        if filename and "." in filename:
-            return filename
+    match = _FILENAME_RE.search(url)
+    if match:
+        return unquote(match.group(1))
 
     # Generate unique filename if none found
     return f"file_{uuid.uuid4().hex[:8]}"
 
 
+@lru_cache(maxsize=256)
+def _guess_by_ext(ext: str) -> Optional[str]:
+    """Memoized mimetype lookup keyed on the lowercased extension."""
+    return mimetypes.types_map.get(ext)
+
+
 def guess_content_type(url: str, headers: dict) -> str:
     """Determine content type from headers or URL."""
     # Try content-type header first
@@ -40,13 +59,18 @@ def guess_content_type(url: str, headers: dict) -> str:
     if content_type and content_type != "application/octet-stream":
         return content_type
 
-    # Fall back to guessing from URL
-    guessed, _ = mimetypes.guess_type(url)
-    return guessed or "application/octet-stream"
+    # Fall back to guessing from the URL's extension; anything long or
+    # containing a slash is the domain/path, not a real extension
+    ext = url.rpartition(".")[2].partition("?")[0].partition("#")[0]
+    if ext and len(ext) <= 8 and "/" not in ext:
+        guessed = _guess_by_ext("." + ext.lower())
+        if guessed:
+            return guessed
+    return "application/octet-stream"
 
 
 @router.post("", response_model=DownloadResponse)
-async def download_file(request: DownloadRequest):
+async def download_file(request: DownloadRequest, http_request: Request):
     """
     Download a file from URL and upload to Supabase storage.
 
@@ -58,34 +82,82 @@ async def download_file(request: DownloadRequest):
         settings = get_settings()
         supabase = get_supabase_client()
 
-        # Download the file
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            response = await client.get(request.url)
-            response.raise_for_status()
-
-        file_content = response.content
-        content_type = guess_content_type(request.url, dict(response.headers))
-
-        # Determine filename
-        if request.filename:
-            filename = request.filename
-        else:
-            filename = extract_filename_from_url(request.url)
-            # Ensure unique filename
-            filename = f"{uuid.uuid4().hex[:8]}_{filename}"
-
-        # Build storage path
-        storage_path = f"{request.folder.value}/{filename}"
-
-        # Upload to Supabase storage
-        result = supabase.storage.from_(request.bucket).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": content_type}
-        )
+        client = http_request.app.state.http
+
+        # Deterministic storage path keyed on the URL: the blake2b prefix
+        # makes repeat downloads of the same URL land on the same object,
+        # so an existing object short-circuits the fetch and re-upload
+        url_key = hashlib.blake2b(request.url.encode(), digest_size=16).hexdigest()
+        filename = request.filename or extract_filename_from_url(request.url)
+        storage_path = f"{request.folder}/{url_key}_{filename}"
+
+        bucket = supabase.storage.from_(request.bucket)
+        try:
+            cached_info = await asyncio.to_thread(bucket.info, storage_path)
+        except Exception:
+            cached_info = None
+        if cached_info:
+            return DownloadResponse(
+                success=True,
+                public_url=bucket.get_public_url(storage_path),
+                storage_path=storage_path,
+                filename=filename,
+                content_type=cached_info.get("contentType") or cached_info.get("content_type"),
+                size=cached_info.get("size"),
+            )
+
+        # Cheap preflight when the caller set a size cap: a HEAD catches
+        # oversized files and HTML error pages before paying for the full
+        # transfer. Servers that 405 on HEAD fall through to the GET.
+        if request.max_size and settings.download_preflight_head:
+            try:
+                head = await client.head(request.url)
+                head.raise_for_status()
+            except httpx.HTTPError:
+                pass
+            else:
+                content_length = int(head.headers.get("content-length") or 0)
+                if content_length > request.max_size:
+                    return DownloadResponse(
+                        success=False,
+                        error=f"File too large: {content_length} bytes exceeds max_size ({request.max_size})",
+                    )
+                if head.headers.get("content-type", "").startswith("text/html"):
+                    return DownloadResponse(
+                        success=False,
+                        error="URL returned an HTML page, not a downloadable file",
+                    )
+
+        # Stream the file into a spooled temp file instead of buffering the
+        # whole body in memory; only files above _SPOOL_MAX_BYTES touch disk
+        size = 0
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spooled:
+            async with client.stream("GET", request.url) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES):
+                    spooled.write(chunk)
+                    size += len(chunk)
+                    # Backstop for servers that omit Content-Length
+                    if request.max_size and size > request.max_size:
+                        return DownloadResponse(
+                            success=False,
+                            error=f"File too large: exceeds max_size ({request.max_size})",
+                        )
+
+            content_type = guess_content_type(request.url, dict(response.headers))
+
+            # Upload to Supabase storage. The sync storage client blocks, so
+            # run it in a worker thread to keep the event loop free.
+            spooled.seek(0)
+            result = await asyncio.to_thread(
+                bucket.upload,
+                path=storage_path,
+                file=spooled.read(),
+                file_options={"content-type": content_type},
+            )
 
         # Get public URL
-        public_url = supabase.storage.from_(request.bucket).get_public_url(storage_path)
+        public_url = bucket.get_public_url(storage_path)
 
         return DownloadResponse(
             success=True,
@@ -93,7 +165,7 @@ async def download_file(request: DownloadRequest):
             storage_path=storage_path,
             filename=filename,
             content_type=content_type,
-            size=len(file_content),
+            size=size,
         )
 
     except httpx.HTTPStatusError as e:
@@ -114,15 +186,15 @@ async def download_file(request: DownloadRequest):
 
 
 @router.get("/info")
-async def get_file_info(url: str):
+async def get_file_info(url: str, http_request: Request):
     """
     Get file info (size, type) from URL without downloading.
     Uses HEAD request to fetch headers only.
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            response = await client.head(url)
-            response.raise_for_status()
+        client = http_request.app.state.http
+        response = await client.head(url)
+        response.raise_for_status()
 
         headers = dict(response.headers)
         content_length = headers.get("content-length")
@@ -1,6 +1,11 @@
 """Parse document endpoint - extracts text from PDF, DOCX, and other documents."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+import asyncio
 import httpx
+import os
+import re
+import shutil
+import tempfile
 from io import BytesIO
 from typing import Optional
 
@@ -9,57 +14,162 @@ from app.models.document import (
     ParseDocumentResponse,
     DocumentType,
 )
+from app.services.cache import TTLCache
 
 router = APIRouter()
 
 
+# URL suffix -> type, one dict lookup instead of an endswith chain
+_EXT_MAP = {
+    "pdf": DocumentType.PDF,
+    "docx": DocumentType.DOCX,
+    "doc": DocumentType.DOC,
+    "txt": DocumentType.TXT,
+    "md": DocumentType.MD,
+    "html": DocumentType.HTML,
+    "htm": DocumentType.HTML,
+    "rtf": DocumentType.RTF,
+}
+
+# Content-type markers matched in one compiled-regex pass; the matched
+# token indexes into the map below
+_CT_RE = re.compile(
+    r"pdf|docx|wordprocessingml|msword|text/plain|text/markdown|text/html|rtf"
+)
+_CT_MAP = {
+    "pdf": DocumentType.PDF,
+    "docx": DocumentType.DOCX,
+    "wordprocessingml": DocumentType.DOCX,
+    "msword": DocumentType.DOC,
+    "text/plain": DocumentType.TXT,
+    "text/markdown": DocumentType.MD,
+    "text/html": DocumentType.HTML,
+    "rtf": DocumentType.RTF,
+}
+
+
 def detect_document_type(url: str, content_type: Optional[str] = None) -> Optional[DocumentType]:
     """Detect document type from URL or content-type header."""
-    url_lower = url.lower()
-
-    # Check URL extension
-    if url_lower.endswith(".pdf"):
-        return DocumentType.PDF
-    elif url_lower.endswith(".docx"):
-        return DocumentType.DOCX
-    elif url_lower.endswith(".doc"):
-        return DocumentType.DOC
-    elif url_lower.endswith(".txt"):
-        return DocumentType.TXT
-    elif url_lower.endswith(".md"):
-        return DocumentType.MD
-    elif url_lower.endswith(".html") or url_lower.endswith(".htm"):
-        return DocumentType.HTML
-    elif url_lower.endswith(".rtf"):
-        return DocumentType.RTF
+    # Check URL extension (query string and fragment stripped first)
+    path = url.partition("?")[0].partition("#")[0].lower()
+    doc_type = _EXT_MAP.get(path.rsplit(".", 1)[-1])
+    if doc_type:
+        return doc_type
 
     # Check content-type
     if content_type:
-        ct_lower = content_type.lower()
-        if "pdf" in ct_lower:
-            return DocumentType.PDF
-        elif "docx" in ct_lower or "wordprocessingml" in ct_lower:
-            return DocumentType.DOCX
-        elif "msword" in ct_lower:
-            return DocumentType.DOC
-        elif "text/plain" in ct_lower:
-            return DocumentType.TXT
-        elif "text/markdown" in ct_lower:
-            return DocumentType.MD
-        elif "text/html" in ct_lower:
-            return DocumentType.HTML
-        elif "rtf" in ct_lower:
-            return DocumentType.RTF
+        match = _CT_RE.search(content_type.lower())
+        if match:
+            return _CT_MAP[match.group()]
 
     return None
 
 
-async def parse_pdf(content: bytes) -> dict:
-    """Parse PDF document using pypdf."""
+# Bound concurrent PDF extractions so a burst of huge documents doesn't
+# saturate every core and starve other requests
+_PDF_PARSE_CONCURRENCY = asyncio.Semaphore(max(2, (os.cpu_count() or 2) - 1))
+
+# Downloads up to this size stay in memory; larger ones spill to disk
+# inside the spooled temp file
+_PARSE_SPOOL_MAX_BYTES = 16 << 20
+_PARSE_CHUNK_BYTES = 1 << 20
+
+# Parsed results keyed by (url, document_type): legal reference documents
+# change rarely, so repeats skip the download and the parse entirely.
+# Entries carrying an ETag are revalidated with If-None-Match; a 304
+# refreshes the entry without transferring the body.
+_PARSE_CACHE_TTL = 3600
+_parse_cache = TTLCache(maxsize=512)
+
+# Compiled once for the last-resort HTML fallback - per-call re.sub
+# recompiles (or at least re-hashes the pattern cache) on every request
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"\S+")
+
+
+def _word_count(text: str) -> int:
+    """Count words without materializing the list str.split() builds."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _extract_pdf_doc(doc) -> dict:
+    """Extract text/metadata from an open MuPDF document, closing it.
+
+    PyMuPDF document objects are not thread-safe, so the page loop stays
+    serial within one thread; moving the whole extraction off the event
+    loop is what keeps other requests responsive.
+    """
+    try:
+        pages = []
+        for page in doc:
+            # Cheap pre-check: a content stream with no BT (begin-text)
+            # operator is an image-only/scanned page - skip the full
+            # extraction pass for it. There is no OCR fallback, so such
+            # pages contribute no text either way.
+            contents = page.read_contents()
+            if contents and b"BT" not in contents:
+                continue
+            pages.append(page.get_text("text"))
+        full_text = "\n\n".join(p for p in pages if p)
+
+        return {
+            "text": full_text,
+            "word_count": _word_count(full_text),
+            "page_count": doc.page_count,
+            "metadata": {
+                "info": doc.metadata or None,
+            }
+        }
+    finally:
+        doc.close()
+
+
+def _parse_pdf_mupdf(content: bytes) -> dict:
+    """Blocking MuPDF extraction from in-memory bytes."""
+    import pymupdf
+
+    return _extract_pdf_doc(pymupdf.open(stream=content, filetype="pdf"))
+
+
+def _parse_pdf_mupdf_path(path: str) -> dict:
+    """Blocking MuPDF extraction from a file on disk (mmap path)."""
+    import pymupdf
+
+    return _extract_pdf_doc(pymupdf.open(path))
+
+
+async def parse_pdf(source) -> dict:
+    """Parse PDF document using PyMuPDF, falling back to pypdf.
+
+    Accepts either the raw bytes or a filesystem path - large downloads
+    stay on disk and MuPDF reads them via mmap instead of holding the
+    whole file in memory. MuPDF extracts text in C and is orders of
+    magnitude faster than pypdf's Python-level content-stream
+    interpretation, and it handles multi-column layouts better.
+    """
+    try:
+        import pymupdf  # noqa: F401 - probe before offloading
+    except ImportError:
+        return await _parse_pdf_pypdf(source)
+
+    parser = _parse_pdf_mupdf if isinstance(source, bytes) else _parse_pdf_mupdf_path
+    async with _PDF_PARSE_CONCURRENCY:
+        try:
+            return await asyncio.to_thread(parser, source)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"PDF parsing failed: {str(e)}"
+            )
+
+
+async def _parse_pdf_pypdf(source) -> dict:
+    """pypdf fallback for parse_pdf (bytes or filesystem path)."""
     try:
         from pypdf import PdfReader
 
-        reader = PdfReader(BytesIO(content))
+        reader = PdfReader(BytesIO(source) if isinstance(source, bytes) else source)
         pages = []
 
         for page in reader.pages:
@@ -68,7 +178,7 @@ async def parse_pdf(content: bytes) -> dict:
                 pages.append(text)
 
         full_text = "\n\n".join(pages)
-        word_count = len(full_text.split())
+        word_count = _word_count(full_text)
 
         return {
             "text": full_text,
@@ -90,44 +200,119 @@ async def parse_pdf(content: bytes) -> dict:
         )
 
 
-async def parse_docx(content: bytes) -> dict:
-    """Parse DOCX document using python-docx."""
-    try:
-        from docx import Document
+# Clark-notation namespaces for direct DOCX XML extraction
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_DCTERMS_NS = "{http://purl.org/dc/terms/}"
 
-        doc = Document(BytesIO(content))
-        paragraphs = []
 
-        for para in doc.paragraphs:
-            if para.text.strip():
-                paragraphs.append(para.text)
+def _parse_docx_xml(content: bytes) -> dict:
+    """Extract DOCX text straight from word/document.xml.
+
+    A DOCX is a zip of XML parts; streaming word/document.xml through
+    lxml's iterparse and collecting <w:t> runs (with <w:p> ends as
+    paragraph boundaries) skips the full style/run/section object model
+    python-docx builds, which is several times faster and far lighter
+    on memory for large documents.
+    """
+    import zipfile
+    from lxml import etree
 
-        full_text = "\n\n".join(paragraphs)
-        word_count = len(full_text.split())
+    text_tag = f"{_W_NS}t"
+    para_tag = f"{_W_NS}p"
 
-        # Extract metadata
+    with zipfile.ZipFile(BytesIO(content)) as archive:
+        paragraphs = []
+        runs = []
+        with archive.open("word/document.xml") as doc_xml:
+            for _, element in etree.iterparse(doc_xml, tag=(text_tag, para_tag)):
+                if element.tag == text_tag:
+                    if element.text:
+                        runs.append(element.text)
+                else:
+                    paragraph = "".join(runs)
+                    if paragraph.strip():
+                        paragraphs.append(paragraph)
+                    runs = []
+                element.clear()
+
+        # Core properties live in their own small part; read it directly
+        # instead of resurrecting the python-docx object model for it
         metadata = {}
-        if doc.core_properties:
-            props = doc.core_properties
+        try:
+            with archive.open("docProps/core.xml") as core_xml:
+                core = etree.parse(core_xml).getroot()
             metadata = {
-                "title": props.title,
-                "author": props.author,
-                "subject": props.subject,
-                "created": str(props.created) if props.created else None,
-                "modified": str(props.modified) if props.modified else None,
+                "title": core.findtext(f"{_DC_NS}title"),
+                "author": core.findtext(f"{_DC_NS}creator"),
+                "subject": core.findtext(f"{_DC_NS}subject"),
+                "created": core.findtext(f"{_DCTERMS_NS}created"),
+                "modified": core.findtext(f"{_DCTERMS_NS}modified"),
             }
+        except KeyError:
+            pass
 
-        return {
-            "text": full_text,
-            "word_count": word_count,
-            "page_count": None,  # DOCX doesn't have pages
-            "metadata": metadata
+    full_text = "\n\n".join(paragraphs)
+
+    return {
+        "text": full_text,
+        "word_count": _word_count(full_text),
+        "page_count": None,  # DOCX doesn't have pages
+        "metadata": metadata,
+    }
+
+
+def _parse_docx_python_docx(content: bytes) -> dict:
+    """python-docx fallback for deployments without lxml."""
+    from docx import Document
+
+    doc = Document(BytesIO(content))
+    paragraphs = []
+
+    for para in doc.paragraphs:
+        if para.text.strip():
+            paragraphs.append(para.text)
+
+    full_text = "\n\n".join(paragraphs)
+    word_count = _word_count(full_text)
+
+    # Extract metadata
+    metadata = {}
+    if doc.core_properties:
+        props = doc.core_properties
+        metadata = {
+            "title": props.title,
+            "author": props.author,
+            "subject": props.subject,
+            "created": str(props.created) if props.created else None,
+            "modified": str(props.modified) if props.modified else None,
         }
-    except ImportError:
-        raise HTTPException(
-            status_code=500,
-            detail="python-docx library not installed. Run: pip install python-docx"
-        )
+
+    return {
+        "text": full_text,
+        "word_count": word_count,
+        "page_count": None,  # DOCX doesn't have pages
+        "metadata": metadata
+    }
+
+
+async def parse_docx(content: bytes) -> dict:
+    """Parse DOCX document via direct XML extraction (python-docx fallback)."""
+    try:
+        try:
+            return await asyncio.to_thread(_parse_docx_xml, content)
+        except ImportError:
+            pass
+
+        try:
+            return await asyncio.to_thread(_parse_docx_python_docx, content)
+        except ImportError:
+            raise HTTPException(
+                status_code=500,
+                detail="python-docx library not installed. Run: pip install python-docx"
+            )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -135,22 +320,39 @@ async def parse_docx(content: bytes) -> dict:
         )
 
 
+def _decode_fallback(content: bytes) -> str:
+    """Best-effort decode for payloads that aren't valid UTF-8.
+
+    charset_normalizer detects the encoding in one pass instead of
+    trial-decoding the whole payload per candidate encoding; the old
+    trial loop remains for deployments without it.
+    """
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        for enc in ("latin-1", "cp1252", "utf-16"):
+            try:
+                return content.decode(enc)
+            except UnicodeDecodeError:
+                continue
+        return content.decode("utf-8", errors="replace")
+
+    best = from_bytes(content).best()
+    if best is not None:
+        return str(best)
+    return content.decode("utf-8", errors="replace")
+
+
 async def parse_text(content: bytes, encoding: str = "utf-8") -> dict:
     """Parse plain text document."""
     try:
+        # Fast path: nearly all payloads are valid UTF-8, and a straight
+        # decode is far cheaper than charset detection
         text = content.decode(encoding)
     except UnicodeDecodeError:
-        # Try other common encodings
-        for enc in ["latin-1", "cp1252", "utf-16"]:
-            try:
-                text = content.decode(enc)
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            text = content.decode("utf-8", errors="replace")
+        text = _decode_fallback(content)
 
-    word_count = len(text.split())
+    word_count = _word_count(text)
 
     return {
         "text": text,
@@ -160,25 +362,73 @@ async def parse_text(content: bytes, encoding: str = "utf-8") -> dict:
     }
 
 
+def _clean_extracted_text(text: str) -> str:
+    """Collapse blank lines and strip per-line whitespace.
+
+    One splitlines + one join; map() keeps the per-line strip in C so
+    large pages are cleaned in a single pass without intermediate lists.
+    """
+    return "\n".join(line for line in map(str.strip, text.splitlines()) if line)
+
+
 async def parse_html(content: bytes) -> dict:
-    """Parse HTML document, extracting text content."""
+    """Parse HTML document, extracting text content.
+
+    Uses selectolax (lexbor) - the tree is built entirely in C and text
+    extraction benchmarks an order of magnitude faster than BeautifulSoup
+    for this strip-tags-and-get-text workload. Falls back to the
+    BeautifulSoup pipeline when selectolax isn't installed.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return await _parse_html_bs4(content)
+
+    tree = LexborHTMLParser(content)
+
+    # Remove script/style and boilerplate chrome
+    for tag in tree.css("script,style,nav,header,footer"):
+        tag.decompose()
+
+    title_node = tree.css_first("title")
+    title = title_node.text() if title_node else None
+
+    body = tree.body
+    text = body.text(separator="\n") if body else ""
+    text = _clean_extracted_text(text)
+
+    return {
+        "text": text,
+        "word_count": _word_count(text),
+        "page_count": None,
+        "metadata": {"title": title},
+    }
+
+
+async def _parse_html_bs4(content: bytes) -> dict:
+    """BeautifulSoup fallback for parse_html."""
     try:
         from bs4 import BeautifulSoup
 
-        soup = BeautifulSoup(content, "html.parser")
+        # lxml tokenizes/builds the tree in C and is several times faster
+        # than the pure-Python html.parser on large pages; fall back when
+        # a deployment doesn't have it
+        try:
+            soup = BeautifulSoup(content, "lxml")
+        except Exception:
+            soup = BeautifulSoup(content, "html.parser")
 
         # Remove script and style elements
         for element in soup(["script", "style", "nav", "header", "footer"]):
             element.decompose()
 
         # Get text
-        text = soup.get_text(separator="\n\n")
+        # Single-newline separator: the double newlines were collapsed by
+        # the cleanup pass anyway, so emitting them just doubled the size
+        # of the intermediate string
+        text = _clean_extracted_text(soup.get_text(separator="\n"))
 
-        # Clean up whitespace
-        lines = [line.strip() for line in text.split("\n")]
-        text = "\n".join(line for line in lines if line)
-
-        word_count = len(text.split())
+        word_count = _word_count(text)
 
         # Extract title if present
         title = soup.title.string if soup.title else None
@@ -191,67 +441,102 @@ async def parse_html(content: bytes) -> dict:
         }
     except ImportError:
         # Fallback without BeautifulSoup - basic text extraction
-        import re
         text = content.decode("utf-8", errors="replace")
-        text = re.sub(r"<[^>]+>", " ", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WS_RE.sub(" ", _TAG_RE.sub(" ", text)).strip()
 
         return {
             "text": text,
-            "word_count": len(text.split()),
+            "word_count": _word_count(text),
             "page_count": None,
             "metadata": {}
         }
 
 
 @router.post("", response_model=ParseDocumentResponse)
-async def parse_document(request: ParseDocumentRequest):
+async def parse_document(request: ParseDocumentRequest, http_request: Request):
     """
     Parse a document from URL and extract text content.
 
     Supported formats:
-    - PDF: Uses pypdf for text extraction
+    - PDF: PyMuPDF text extraction (pypdf fallback). Image-only/scanned
+      pages are skipped - there is no OCR fallback
     - DOCX: Uses python-docx for text extraction
     - TXT/MD: Direct text reading
     - HTML: Extracts text content, strips tags
     """
     try:
-        # Download the document
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-            response = await client.get(request.url)
-            response.raise_for_status()
-
-        content = response.content
-        content_type = response.headers.get("content-type", "")
-
-        # Determine document type
-        doc_type = request.document_type or detect_document_type(request.url, content_type)
-
-        if not doc_type:
-            return ParseDocumentResponse(
-                success=False,
-                error="Could not determine document type. Please specify document_type."
-            )
-
-        # Parse based on type
-        if doc_type == DocumentType.PDF:
-            result = await parse_pdf(content)
-        elif doc_type in [DocumentType.DOCX, DocumentType.DOC]:
-            result = await parse_docx(content)
-        elif doc_type in [DocumentType.TXT, DocumentType.MD]:
-            result = await parse_text(content)
-        elif doc_type == DocumentType.HTML:
-            result = await parse_html(content)
-        elif doc_type == DocumentType.RTF:
-            # RTF can be treated as text with some cleanup
-            result = await parse_text(content)
-        else:
-            return ParseDocumentResponse(
-                success=False,
-                error=f"Unsupported document type: {doc_type}"
-            )
-
-        return ParseDocumentResponse(
+        cache_key = (request.url, request.document_type or "")
+        cached = _parse_cache.get(cache_key)
+        conditional_headers = None
+        if cached is not None:
+            etag, cached_response = cached
+            if not etag:
+                # Nothing to revalidate against; TTL bounds staleness
+                return cached_response
+            conditional_headers = {"If-None-Match": etag}
+
+        # Stream the document on the shared pooled client into a spooled
+        # temp file - only downloads past the spool limit touch disk, and
+        # the event loop never holds response.content plus a copy
+        client = http_request.app.state.http
+        size = 0
+        with tempfile.SpooledTemporaryFile(max_size=_PARSE_SPOOL_MAX_BYTES) as spool:
+            async with client.stream(
+                "GET", request.url, timeout=60.0, headers=conditional_headers
+            ) as response:
+                if cached is not None and response.status_code == 304:
+                    # Unchanged upstream - refresh the entry and skip the
+                    # transfer and the re-parse
+                    _parse_cache.set(cache_key, cached, _PARSE_CACHE_TTL)
+                    return cached_response
+                response.raise_for_status()
+                content_type = response.headers.get("content-type", "")
+                etag = response.headers.get("etag")
+                async for chunk in response.aiter_bytes(chunk_size=_PARSE_CHUNK_BYTES):
+                    spool.write(chunk)
+                    size += len(chunk)
+
+            # Determine document type (request field is a plain string
+            # literal; DocumentType stays the internal dispatch enum)
+            if request.document_type:
+                doc_type = DocumentType(request.document_type)
+            else:
+                doc_type = detect_document_type(request.url, content_type)
+
+            if not doc_type:
+                return ParseDocumentResponse(
+                    success=False,
+                    error="Could not determine document type. Please specify document_type."
+                )
+
+            # Parse based on type
+            spool.seek(0)
+            if doc_type == DocumentType.PDF:
+                if size > _PARSE_SPOOL_MAX_BYTES:
+                    # Already spilled to disk: hand MuPDF a real file so
+                    # it reads via mmap instead of a giant bytes object
+                    with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp:
+                        shutil.copyfileobj(spool, tmp, _PARSE_CHUNK_BYTES)
+                        tmp.flush()
+                        result = await parse_pdf(tmp.name)
+                else:
+                    result = await parse_pdf(spool.read())
+            elif doc_type in [DocumentType.DOCX, DocumentType.DOC]:
+                result = await parse_docx(spool.read())
+            elif doc_type in [DocumentType.TXT, DocumentType.MD]:
+                result = await parse_text(spool.read())
+            elif doc_type == DocumentType.HTML:
+                result = await parse_html(spool.read())
+            elif doc_type == DocumentType.RTF:
+                # RTF can be treated as text with some cleanup
+                result = await parse_text(spool.read())
+            else:
+                return ParseDocumentResponse(
+                    success=False,
+                    error=f"Unsupported document type: {doc_type}"
+                )
+
+        parsed = ParseDocumentResponse(
             success=True,
             text=result["text"],
             word_count=result["word_count"],
@@ -259,6 +544,8 @@ async def parse_document(request: ParseDocumentRequest):
             document_type=doc_type.value,
             metadata=result.get("metadata"),
         )
+        _parse_cache.set(cache_key, (etag, parsed), _PARSE_CACHE_TTL)
+        return parsed
 
     except httpx.HTTPStatusError as e:
         return ParseDocumentResponse(
@@ -1,6 +1,7 @@
 """Scrape endpoint - single URL scraping using Firecrawl."""
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 import httpx
+import orjson
 
 from app.config import get_settings
 from app.models.document import ScrapeRequest, ScrapeResponse
@@ -11,7 +12,7 @@ FIRECRAWL_API_URL = "https://api.firecrawl.dev/v1"
 
 
 @router.post("", response_model=ScrapeResponse)
-async def scrape_url(request: ScrapeRequest):
+async def scrape_url(request: ScrapeRequest, http_request: Request):
     """
     Scrape a single URL using Firecrawl API.
 
@@ -41,19 +42,23 @@ async def scrape_url(request: ScrapeRequest):
         if request.wait_for:
             payload["waitFor"] = request.wait_for
 
-        # Call Firecrawl API
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{FIRECRAWL_API_URL}/scrape",
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {settings.firecrawl_api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-            response.raise_for_status()
+        # Call Firecrawl API on the shared pooled client; scrapes can run
+        # long, so the default timeout is overridden per-call
+        client = http_request.app.state.http
+        response = await client.post(
+            f"{FIRECRAWL_API_URL}/scrape",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {settings.firecrawl_api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=60.0,
+        )
+        response.raise_for_status()
 
-        data = response.json()
+        # Scraped pages can be large; orjson.loads is markedly faster
+        # than httpx's stdlib-json .json()
+        data = orjson.loads(response.content)
 
         if not data.get("success"):
             return ScrapeResponse(
@@ -104,7 +109,7 @@ async def scrape_url(request: ScrapeRequest):
 
 
 @router.post("/batch")
-async def scrape_batch(urls: list[str]):
+async def scrape_batch(urls: list[str], http_request: Request):
     """
     Scrape multiple URLs in a single request.
     Uses Firecrawl batch endpoint for efficiency.
@@ -118,21 +123,22 @@ async def scrape_batch(urls: list[str]):
         )
 
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                f"{FIRECRAWL_API_URL}/batch/scrape",
-                json={
-                    "urls": urls,
-                    "formats": ["markdown"],
-                },
-                headers={
-                    "Authorization": f"Bearer {settings.firecrawl_api_key}",
-                    "Content-Type": "application/json",
-                }
-            )
-            response.raise_for_status()
+        client = http_request.app.state.http
+        response = await client.post(
+            f"{FIRECRAWL_API_URL}/batch/scrape",
+            json={
+                "urls": urls,
+                "formats": ["markdown"],
+            },
+            headers={
+                "Authorization": f"Bearer {settings.firecrawl_api_key}",
+                "Content-Type": "application/json",
+            },
+            timeout=120.0,
+        )
+        response.raise_for_status()
 
-        data = response.json()
+        data = orjson.loads(response.content)
 
         return {
             "success": data.get("success", False),
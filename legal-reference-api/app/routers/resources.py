@@ -1,3 +1,5 @@
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, Query
 from supabase import Client
 from typing import Optional
@@ -27,40 +29,47 @@ async def list_resources(
     List resources with optional filters and pagination.
     """
     try:
-        # Build query
+        # Build query. The category slug filter runs server-side through
+        # the embedded join (!inner applies the filter as an INNER JOIN),
+        # so pagination and the exact count see only matching rows
+        category_select = (
+            "category:lr_categories!inner(*)" if category else "category:lr_categories(*)"
+        )
         query_builder = supabase.table("lr_resources").select(
-            "*, category:lr_categories(*)",
+            f"*, {category_select}",
             count="exact"
         )
 
         # Apply filters
         query_builder = query_builder.eq("is_public", True)
 
+        if category:
+            query_builder = query_builder.eq("category.slug", category)
+
         if source_type:
             query_builder = query_builder.eq("source_type", source_type.value)
 
         if query:
-            query_builder = query_builder.or_(
-                f"title.ilike.%{query}%,description.ilike.%{query}%"
+            # GIN-indexed tsvector column (see resources_fts.sql) instead
+            # of two un-indexed ILIKE scans. "web_search" is supabase-py's
+            # spelling for websearch_to_tsquery, which accepts free-form
+            # user input; unrecognized types fall through to to_tsquery,
+            # which rejects multi-word queries
+            query_builder = query_builder.text_search(
+                "fts", query, options={"type": "web_search", "config": "english"}
             )
 
         # Order and paginate
         query_builder = query_builder.order("created_at", desc=True)
         query_builder = query_builder.range(offset, offset + limit - 1)
 
-        result = query_builder.execute()
-
-        # Filter by category slug if provided (done after fetch due to nested filter)
-        resources = result.data
-        if category:
-            resources = [
-                r for r in resources
-                if r.get("category") and r["category"].get("slug") == category
-            ]
+        # The supabase-py client blocks on its HTTP round trip; run it in
+        # a worker thread so the event loop keeps serving other requests
+        result = await asyncio.to_thread(query_builder.execute)
 
         return ResourceListResponse(
-            resources=resources,
-            count=result.count or len(resources),
+            resources=result.data,
+            count=result.count or len(result.data),
             limit=limit,
             offset=offset,
         )
@@ -78,28 +87,21 @@ async def create_resource(
     Create a new resource.
     """
     try:
-        # Prepare data
+        # Prepare data (enum-typed fields are plain strings via Literal)
         data = resource.model_dump(exclude_none=True)
 
-        # Convert enum to string
-        if "source_type" in data:
-            data["source_type"] = data["source_type"].value
-        if "content_source" in data and data["content_source"]:
-            data["content_source"] = data["content_source"].value
-
-        # Insert
-        result = supabase.table("lr_resources").insert(data).execute()
+        # Insert; chaining .select() asks PostgREST to return the new row
+        # with the category embedded, saving the follow-up fetch
+        result = await asyncio.to_thread(
+            supabase.table("lr_resources").insert(data).select(
+                "*, category:lr_categories(*)"
+            ).execute
+        )
 
         if not result.data:
             raise HTTPException(status_code=400, detail="Failed to create resource")
 
-        # Fetch with category
-        resource_id = result.data[0]["id"]
-        fetch_result = supabase.table("lr_resources").select(
-            "*, category:lr_categories(*)"
-        ).eq("id", resource_id).single().execute()
-
-        return fetch_result.data
+        return result.data[0]
 
     except HTTPException:
         raise
@@ -116,9 +118,11 @@ async def get_resource(
     Get a single resource by ID.
     """
     try:
-        result = supabase.table("lr_resources").select(
-            "*, category:lr_categories(*)"
-        ).eq("id", resource_id).execute()
+        result = await asyncio.to_thread(
+            supabase.table("lr_resources").select(
+                "*, category:lr_categories(*)"
+            ).eq("id", resource_id).execute
+        )
 
         if not result.data:
             raise HTTPException(status_code=404, detail="Resource not found")
@@ -141,40 +145,26 @@ async def update_resource(
     Update an existing resource.
     """
     try:
-        # Check if resource exists
-        existing = supabase.table("lr_resources").select("id").eq(
-            "id", resource_id
-        ).execute()
-
-        if not existing.data:
-            raise HTTPException(status_code=404, detail="Resource not found")
-
         # Prepare update data
         data = resource.model_dump(exclude_none=True, exclude_unset=True)
 
         if not data:
             raise HTTPException(status_code=400, detail="No fields to update")
 
-        # Convert enums to strings
-        if "source_type" in data:
-            data["source_type"] = data["source_type"].value
-        if "content_source" in data and data["content_source"]:
-            data["content_source"] = data["content_source"].value
-
-        # Update
-        result = supabase.table("lr_resources").update(data).eq(
-            "id", resource_id
-        ).execute()
+        # Update; no preliminary existence check - the update returns the
+        # affected rows, so an empty result means the id did not match.
+        # Chaining .select() embeds the category in the returned row, so
+        # no follow-up fetch is needed either
+        result = await asyncio.to_thread(
+            supabase.table("lr_resources").update(data).eq(
+                "id", resource_id
+            ).select("*, category:lr_categories(*)").execute
+        )
 
         if not result.data:
-            raise HTTPException(status_code=400, detail="Failed to update resource")
-
-        # Fetch with category
-        fetch_result = supabase.table("lr_resources").select(
-            "*, category:lr_categories(*)"
-        ).eq("id", resource_id).single().execute()
+            raise HTTPException(status_code=404, detail="Resource not found")
 
-        return fetch_result.data
+        return result.data[0]
 
     except HTTPException:
         raise
@@ -191,17 +181,17 @@ async def delete_resource(
     Delete a resource.
     """
     try:
-        # Check if resource exists
-        existing = supabase.table("lr_resources").select("id").eq(
-            "id", resource_id
-        ).execute()
+        # Delete directly; the deleted rows come back in the result, so an
+        # empty result doubles as the existence check
+        result = await asyncio.to_thread(
+            supabase.table("lr_resources").delete().eq(
+                "id", resource_id
+            ).execute
+        )
 
-        if not existing.data:
+        if not result.data:
             raise HTTPException(status_code=404, detail="Resource not found")
 
-        # Delete
-        supabase.table("lr_resources").delete().eq("id", resource_id).execute()
-
         return None
 
     except HTTPException:
@@ -1,5 +1,9 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from collections import Counter
 import asyncio
+import orjson
+import time
 
 from app.models.search import (
     CombinedSearchRequest,
@@ -25,10 +29,59 @@ from app.routers.search import (
 
 router = APIRouter()
 
+# A single slow upstream should not gate the whole combined response, so
+# every source task is capped at this many seconds
+_SOURCE_TIMEOUT_SECONDS = 15.0
 
-@router.post("", response_model=CombinedSearchResponse)
-async def search_combined(request: CombinedSearchRequest):
-    """Execute searches across multiple sources in parallel."""
+# After this many consecutive failures a source is skipped entirely for
+# the cooldown window instead of burning a timeout on every request
+_BREAKER_FAILURE_THRESHOLD = 3
+_BREAKER_COOLDOWN_SECONDS = 60.0
+
+
+class _SourceBreaker:
+    """In-process circuit breaker tracking consecutive per-source failures."""
+
+    def __init__(self):
+        self._failures = Counter()
+        self._open_until = {}
+
+    def is_open(self, key: str) -> bool:
+        return time.monotonic() < self._open_until.get(key, 0.0)
+
+    def record_success(self, key: str) -> None:
+        self._failures[key] = 0
+
+    def record_failure(self, key: str) -> None:
+        self._failures[key] += 1
+        if self._failures[key] >= _BREAKER_FAILURE_THRESHOLD:
+            self._open_until[key] = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+            self._failures[key] = 0
+
+
+_breaker = _SourceBreaker()
+
+
+async def _bounded(key: str, coro):
+    """Run a source search under the per-source timeout and breaker.
+
+    Returns the source's response, or None if the source is currently
+    short-circuited, times out, or raises.
+    """
+    if _breaker.is_open(key):
+        coro.close()
+        return None
+    try:
+        response = await asyncio.wait_for(coro, timeout=_SOURCE_TIMEOUT_SECONDS)
+    except Exception:
+        _breaker.record_failure(key)
+        return None
+    _breaker.record_success(key)
+    return response
+
+
+def _build_search_tasks(request: CombinedSearchRequest) -> dict:
+    """Map each enabled source name to its (un-awaited) search coroutine."""
     tasks = {}
 
     # Create base request for simple searches
@@ -89,20 +142,35 @@ async def search_combined(request: CombinedSearchRequest):
         )
         tasks["unicourt"] = unicourt.search_unicourt(uc_request)
 
+    return tasks
+
+
+@router.post(
+    "",
+    response_model=CombinedSearchResponse,
+    # Disabled sources stay None - drop them from the payload instead of
+    # serializing nine nulls on every combined search
+    response_model_exclude_none=True,
+)
+async def search_combined(request: CombinedSearchRequest):
+    """Execute searches across multiple sources in parallel."""
+    tasks = _build_search_tasks(request)
+
     # Execute all searches in parallel
     results = {}
     total = 0
 
     if tasks:
         task_keys = list(tasks.keys())
-        task_coros = list(tasks.values())
 
-        # Use gather with return_exceptions to handle failures gracefully
-        responses = await asyncio.gather(*task_coros, return_exceptions=True)
+        # Each task runs under the per-source timeout and circuit breaker;
+        # failures come back as None so other sources still complete
+        responses = await asyncio.gather(
+            *(_bounded(key, coro) for key, coro in tasks.items())
+        )
 
         for key, response in zip(task_keys, responses):
-            if isinstance(response, Exception):
-                # Log error but continue with other results
+            if response is None:
                 results[key] = SourceSearchResult(results=[], count=0)
             else:
                 results[key] = SourceSearchResult(
@@ -111,16 +179,39 @@ async def search_combined(request: CombinedSearchRequest):
                 )
                 total += response.count
 
-    return CombinedSearchResponse(
-        google=results.get("google"),
-        youtube=results.get("youtube"),
-        books=results.get("books"),
-        openlibrary=results.get("openlibrary"),
-        courtlistener=results.get("courtlistener"),
-        congress=results.get("congress"),
-        federalregister=results.get("federalregister"),
-        loc=results.get("loc"),
-        unicourt=results.get("unicourt"),
-        total=total,
-        query=request.query,
-    )
+    # Only populated sources are passed; the rest default to None
+    return CombinedSearchResponse(**results, total=total, query=request.query)
+
+
+async def _tagged(key: str, coro):
+    """Await a bounded search coroutine paired with its source name."""
+    return key, await _bounded(key, coro)
+
+
+@router.post("/stream")
+async def search_combined_stream(request: CombinedSearchRequest):
+    """
+    Execute searches across multiple sources and stream results as NDJSON.
+
+    Each line is one source's results, emitted as soon as that upstream
+    responds - clients see the fastest sources immediately instead of
+    waiting for the slowest. The non-streaming endpoint above remains
+    for clients that want one atomic payload.
+    """
+    tasks = _build_search_tasks(request)
+
+    async def generate():
+        pending = [_tagged(key, coro) for key, coro in tasks.items()]
+        for future in asyncio.as_completed(pending):
+            key, response = await future
+            if response is None:
+                line = {"source": key, "results": [], "count": 0}
+            else:
+                line = {
+                    "source": key,
+                    "results": response.model_dump(mode="json")["results"],
+                    "count": response.count,
+                }
+            yield orjson.dumps(line) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
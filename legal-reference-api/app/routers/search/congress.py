@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
+import orjson
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
+from app.services.search_cache import cached_search
 from app.models.search import (
     BaseSearchRequest,
     SearchResponse,
@@ -11,8 +15,17 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+# Bound format method; the template is parsed once at import instead of
+# per item in the transform loop
+_BILL_URL = "https://www.congress.gov/bill/{}th-congress/{}/{}".format
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("congress", ttl=3600)
 async def search_congress(request: BaseSearchRequest):
     """Search Congress.gov for bills and legislation."""
     settings = get_settings()
@@ -32,47 +45,51 @@ async def search_congress(request: BaseSearchRequest):
     if settings.congress_api_key:
         params["api_key"] = settings.congress_api_key
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://api.congress.gov/v3/bill",
-            params=params,
-            headers={"User-Agent": "LegalReferenceLibrary/1.0"},
-        )
+    client = get_http_client()
+    response = await client.get(
+        "https://api.congress.gov/v3/bill",
+        params=params,
+        headers={"User-Agent": "LegalReferenceLibrary/1.0"},
+    )
 
-        if response.status_code in (401, 403):
-            # Return helpful error for missing API key
-            return SearchResponse(
-                results=[],
-                count=0,
-                query=search_query,
-                error="Congress.gov API key required. Get one free at api.congress.gov",
-            )
+    if response.status_code in (401, 403):
+        # Return helpful error for missing API key
+        return SearchResponse(
+            results=[],
+            count=0,
+            query=search_query,
+            error="Congress.gov API key required. Get one free at api.congress.gov",
+        )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Congress.gov API error: {response.text}",
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Congress.gov API error: {response.text}",
+        )
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
-    # Transform results
+    # Transform results; bind the append method once so the loop body
+    # skips the repeated attribute lookup
     results = []
+    append = results.append
     for item in data.get("bills", []):
-        # Build snippet with bill details
-        snippet = item.get("title", "")
+        # Build snippet with bill details; single join instead of
+        # += string churn
+        snippet_parts = [item.get("title", "")]
         latest_action = item.get("latestAction")
         if latest_action:
             action_date = latest_action.get("actionDate", "")
             action_text = latest_action.get("text", "")
-            snippet += f" Latest action ({action_date}): {action_text}"
+            snippet_parts.append(f"Latest action ({action_date}): {action_text}")
         sponsors = item.get("sponsors", [])
         if sponsors:
             sponsor = sponsors[0]
             name = sponsor.get("name", "")
             party = sponsor.get("party", "")
             state = sponsor.get("state", "")
-            snippet += f" Sponsor: {name} ({party}-{state})"
+            snippet_parts.append(f"Sponsor: {name} ({party}-{state})")
+        snippet = " ".join(snippet_parts)
 
         # Truncate snippet
         if len(snippet) > 300:
@@ -83,17 +100,17 @@ async def search_congress(request: BaseSearchRequest):
         bill_number = item.get("number", "")
         congress_num = item.get("congress", "118")
 
-        results.append(
-            SearchResult(
+        append(
+            dict(
                 title=f"{item.get('type', 'Bill')} {bill_number}: {item.get('title', 'Untitled')}",
-                url=f"https://www.congress.gov/bill/{congress_num}th-congress/{bill_type}/{bill_number}",
+                url=_BILL_URL(congress_num, bill_type, bill_number),
                 snippet=snippet,
                 source_type=SourceType.DOCUMENT,
             )
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
         total=data.get("pagination", {}).get("count"),
         query=search_query,
@@ -1,20 +1,27 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
 
 from app.config import get_settings
+from app.services.http_client import get_http_client, stream_json_items
+from app.services.search_cache import cached_search
 from app.models.search import (
     CourtListenerSearchRequest,
     SearchResponse,
     SearchResult,
-    SearchResultMetadata,
     SourceType,
     CourtListenerSearchType,
 )
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("courtlistener", ttl=600)
 async def search_courtlistener(request: CourtListenerSearchRequest):
     """Search CourtListener legal database."""
     settings = get_settings()
@@ -47,24 +54,27 @@ async def search_courtlistener(request: CourtListenerSearchRequest):
     if settings.courtlistener_api_token:
         headers["Authorization"] = f"Token {settings.courtlistener_api_token}"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
+    # Responses here regularly exceed 500KB; parse the results array
+    # incrementally while the body streams instead of buffering it all
+    client = get_http_client()
+    try:
+        items, total = await stream_json_items(
+            client,
             "https://www.courtlistener.com/api/rest/v4/search/",
             params=params,
             headers=headers,
+            total_prefix="count",
+            limit=min(request.limit, 50),
+        )
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"CourtListener API error: {e.response.text}",
         )
-
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"CourtListener API error: {response.text}",
-            )
-
-        data = response.json()
 
     # Transform results
     results = []
-    for item in data.get("results", []):
+    for item in items:
         # Get snippet from opinions array
         opinion_snippet = ""
         opinions = item.get("opinions", [])
@@ -82,14 +92,14 @@ async def search_courtlistener(request: CourtListenerSearchRequest):
             snippet = snippet[:297] + "..."
 
         results.append(
-            SearchResult(
+            dict(
                 title=item.get("caseName")
                 or item.get("caseNameShort")
                 or "Unknown Case",
                 url=f"https://www.courtlistener.com{item.get('absolute_url', '')}",
                 snippet=snippet,
                 source_type=SourceType.DOCUMENT,
-                metadata=SearchResultMetadata(
+                metadata=dict(
                     docket_number=item.get("docketNumber"),
                     date_filed=item.get("dateFiled"),
                     court=item.get("court"),
@@ -98,8 +108,8 @@ async def search_courtlistener(request: CourtListenerSearchRequest):
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
-        total=data.get("count"),
+        total=total,
         query=search_query,
     )
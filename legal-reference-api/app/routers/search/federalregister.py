@@ -1,6 +1,9 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
 
+from app.services.http_client import get_http_client, stream_json_items
+from app.services.search_cache import cached_search
 from app.models.search import (
     BaseSearchRequest,
     SearchResponse,
@@ -10,8 +13,13 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("federalregister", ttl=600)
 async def search_federalregister(request: BaseSearchRequest):
     """Search Federal Register API."""
     # Build search query
@@ -26,36 +34,43 @@ async def search_federalregister(request: BaseSearchRequest):
         "order": "relevance",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
+    # Parse the results array incrementally while the body streams
+    # instead of buffering the whole payload first
+    client = get_http_client()
+    try:
+        items, total = await stream_json_items(
+            client,
             "https://www.federalregister.gov/api/v1/documents.json",
             params=params,
             headers={"User-Agent": "LegalReferenceLibrary/1.0"},
+            total_prefix="count",
+        )
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail=f"Federal Register API error: {e.response.text}",
         )
-
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Federal Register API error: {response.text}",
-            )
-
-        data = response.json()
 
     # Transform results
     results = []
-    for item in data.get("results", []):
-        # Build snippet with document details
-        snippet = item.get("abstract") or item.get("title") or ""
+    for item in items:
+        # Build snippet with document details; collecting parts and
+        # joining once avoids re-copying the string per prepend
+        snippet_parts = []
+        doc_type = item.get("type")
+        if doc_type:
+            snippet_parts.append(f"[{doc_type}]")
+        pub_date = item.get("publication_date")
+        if pub_date:
+            snippet_parts.append(f"Published: {pub_date}.")
         agencies = item.get("agencies", [])
         if agencies:
             agency_names = ", ".join(a.get("name", "") for a in agencies if a.get("name"))
-            snippet = f"Agency: {agency_names}. {snippet}"
-        pub_date = item.get("publication_date")
-        if pub_date:
-            snippet = f"Published: {pub_date}. {snippet}"
-        doc_type = item.get("type")
-        if doc_type:
-            snippet = f"[{doc_type}] {snippet}"
+            snippet_parts.append(f"Agency: {agency_names}.")
+        abstract = item.get("abstract") or item.get("title")
+        if abstract:
+            snippet_parts.append(abstract)
+        snippet = " ".join(snippet_parts)
 
         # Truncate snippet
         if len(snippet) > 300:
@@ -65,7 +80,7 @@ async def search_federalregister(request: BaseSearchRequest):
         source_type = SourceType.PDF if item.get("pdf_url") else SourceType.DOCUMENT
 
         results.append(
-            SearchResult(
+            dict(
                 title=item.get("title", ""),
                 url=item.get("html_url", ""),
                 snippet=snippet,
@@ -74,8 +89,8 @@ async def search_federalregister(request: BaseSearchRequest):
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
-        total=data.get("count"),
+        total=total,
         query=search_query,
     )
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
+import orjson
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
+from app.services.search_cache import cached_search
 from app.models.search import (
     GoogleSearchRequest,
     SearchResponse,
@@ -12,20 +16,37 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+
+# Query suffix per file-type filter, looked up instead of branching
+_FILETYPE_SUFFIX = {
+    FileTypeFilter.PDF: " filetype:pdf",
+    FileTypeFilter.DOC: " (filetype:doc OR filetype:docx)",
+    FileTypeFilter.EBOOK: " (filetype:epub OR filetype:mobi OR filetype:pdf ebook)",
+}
+
+# Suffix tuples let each check be one C-level endswith call
+_DOCUMENT_SUFFIXES = (".doc", ".docx")
+_EBOOK_SUFFIXES = (".epub", ".mobi")
+
 
 def detect_source_type(url: str) -> SourceType:
     """Detect source type from URL."""
     lower_url = url.lower()
     if lower_url.endswith(".pdf"):
         return SourceType.PDF
-    if lower_url.endswith(".doc") or lower_url.endswith(".docx"):
+    if lower_url.endswith(_DOCUMENT_SUFFIXES):
         return SourceType.DOCUMENT
-    if lower_url.endswith(".epub") or lower_url.endswith(".mobi"):
+    if lower_url.endswith(_EBOOK_SUFFIXES):
         return SourceType.EBOOK
     return SourceType.WEBSITE
 
 
 @router.post("", response_model=SearchResponse)
+@cached_search("google", ttl=300)
 async def search_google(request: GoogleSearchRequest):
     """Search using Google Custom Search API."""
     settings = get_settings()
@@ -41,13 +62,8 @@ async def search_google(request: GoogleSearchRequest):
     )
 
     # Add file type filter to query
-    if request.file_type and request.file_type != FileTypeFilter.ALL:
-        if request.file_type == FileTypeFilter.PDF:
-            search_query += " filetype:pdf"
-        elif request.file_type == FileTypeFilter.DOC:
-            search_query += " (filetype:doc OR filetype:docx)"
-        elif request.file_type == FileTypeFilter.EBOOK:
-            search_query += " (filetype:epub OR filetype:mobi OR filetype:pdf ebook)"
+    if request.file_type:
+        search_query += _FILETYPE_SUFFIX.get(request.file_type, "")
 
     # Call Google Custom Search API
     params = {
@@ -57,21 +73,23 @@ async def search_google(request: GoogleSearchRequest):
         "num": min(request.limit, 10),  # Google API max is 10 per request
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://www.googleapis.com/customsearch/v1", params=params
-        )
+    client = get_http_client()
+    response = await client.get(
+        "https://www.googleapis.com/customsearch/v1", params=params
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"Google Search API error: {response.text}",
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"Google Search API error: {response.text}",
+        )
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
-    # Transform results
+    # Transform results; bind the append method once and look each
+    # repeated field up a single time per item
     results = []
+    append = results.append
     for item in data.get("items", []):
         thumbnail = None
         if "pagemap" in item and "cse_thumbnail" in item["pagemap"]:
@@ -79,18 +97,19 @@ async def search_google(request: GoogleSearchRequest):
             if thumbnails:
                 thumbnail = thumbnails[0].get("src")
 
-        results.append(
-            SearchResult(
+        link = item.get("link", "")
+        append(
+            dict(
                 title=item.get("title", ""),
-                url=item.get("link", ""),
+                url=link,
                 snippet=item.get("snippet"),
-                source_type=detect_source_type(item.get("link", "")),
+                source_type=detect_source_type(link),
                 thumbnail=thumbnail,
             )
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
         query=search_query,
     )
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
 
+from app.services.http_client import get_http_client, stream_json_items
+from app.services.search_cache import cached_search
 from app.models.search import (
     BaseSearchRequest,
     SearchResponse,
@@ -10,8 +13,13 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("loc", ttl=3600)
 async def search_loc(request: BaseSearchRequest):
     """Search Library of Congress API."""
     # Build search query
@@ -27,41 +35,44 @@ async def search_loc(request: BaseSearchRequest):
         "fa": "online-format:pdf|online-format:online text",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
+    # LoC payloads run into the hundreds of KB; parse the results array
+    # incrementally while the body streams instead of buffering it all
+    client = get_http_client()
+    try:
+        items, total = await stream_json_items(
+            client,
             "https://www.loc.gov/search/",
             params=params,
             headers={
                 "User-Agent": "LegalReferenceLibrary/1.0",
                 "Accept": "application/json",
             },
+            total_prefix="pagination.total",
+        )
+    except httpx.HTTPStatusError as e:
+        raise HTTPException(
+            status_code=e.response.status_code,
+            detail="Library of Congress API error",
         )
-
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail="Library of Congress API error",
-            )
-
-        data = response.json()
 
     # Transform results
     results = []
-    for item in data.get("results", []):
-        # Build description
-        snippet = ""
+    for item in items:
+        # Build description; single join instead of += string churn
+        snippet_parts = []
         descriptions = item.get("description", [])
         if descriptions:
-            snippet = descriptions[0]
+            snippet_parts.append(descriptions[0])
         contributors = item.get("contributor", [])
         if contributors:
-            snippet += f" By: {', '.join(contributors)}." if snippet else f"By: {', '.join(contributors)}."
+            snippet_parts.append(f"By: {', '.join(contributors)}.")
         date = item.get("date")
         if date:
-            snippet += f" Date: {date}."
+            snippet_parts.append(f"Date: {date}.")
         subjects = item.get("subject", [])
         if subjects:
-            snippet += f" Subjects: {', '.join(subjects[:3])}."
+            snippet_parts.append(f"Subjects: {', '.join(subjects[:3])}.")
+        snippet = " ".join(snippet_parts)
 
         # Truncate snippet
         if len(snippet) > 300:
@@ -88,7 +99,7 @@ async def search_loc(request: BaseSearchRequest):
         url = item.get("url") or f"https://www.loc.gov/item/{item_id}"
 
         results.append(
-            SearchResult(
+            dict(
                 title=item.get("title", "Untitled"),
                 url=url,
                 snippet=snippet or "No description available",
@@ -97,10 +108,9 @@ async def search_loc(request: BaseSearchRequest):
             )
         )
 
-    pagination = data.get("pagination", {})
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
-        total=pagination.get("total"),
+        total=total,
         query=search_query,
     )
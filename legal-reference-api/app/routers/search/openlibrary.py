@@ -1,6 +1,10 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
+import orjson
 
+from app.services.http_client import get_http_client
+from app.services.search_cache import cached_search
 from app.models.search import (
     BaseSearchRequest,
     SearchResponse,
@@ -10,8 +14,18 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+# Bound format methods; templates are parsed once at import instead of
+# per item in the transform loop
+_BOOK_URL = "https://openlibrary.org{}".format
+_COVER_URL = "https://covers.openlibrary.org/b/id/{}-M.jpg".format
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("openlibrary", ttl=3600)
 async def search_openlibrary(request: BaseSearchRequest):
     """Search Open Library API."""
     # Build search query - add law subject for relevance
@@ -28,50 +42,46 @@ async def search_openlibrary(request: BaseSearchRequest):
         "fields": "key,title,author_name,first_publish_year,publisher,subject,cover_i,isbn,ebook_access",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://openlibrary.org/search.json",
-            params=params,
-            headers={"User-Agent": "LegalReferenceLibrary/1.0"},
-        )
+    client = get_http_client()
+    response = await client.get(
+        "https://openlibrary.org/search.json",
+        params=params,
+        headers={"User-Agent": "LegalReferenceLibrary/1.0"},
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail="Open Library API error",
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail="Open Library API error",
+        )
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
     # Transform results
     results = []
     for doc in data.get("docs", []):
-        # Build description
-        snippet = ""
+        # Build description; single join instead of += string churn
+        snippet_parts = []
         authors = doc.get("author_name", [])
         if authors:
-            snippet = f"By {', '.join(authors)}."
+            snippet_parts.append(f"By {', '.join(authors)}.")
         first_publish_year = doc.get("first_publish_year")
         if first_publish_year:
-            snippet += f" First published: {first_publish_year}."
+            snippet_parts.append(f"First published: {first_publish_year}.")
         publishers = doc.get("publisher", [])
         if publishers:
-            snippet += f" Publisher: {publishers[0]}."
+            snippet_parts.append(f"Publisher: {publishers[0]}.")
         subjects = doc.get("subject", [])
         if subjects:
-            snippet += f" Subjects: {', '.join(subjects[:3])}."
+            snippet_parts.append(f"Subjects: {', '.join(subjects[:3])}.")
+        snippet = " ".join(snippet_parts)
 
         # Build URL to Open Library
-        book_key = doc.get("key", "")
-        book_url = f"https://openlibrary.org{book_key}"
+        book_url = _BOOK_URL(doc.get("key", ""))
 
         # Build thumbnail URL
         cover_id = doc.get("cover_i")
-        thumbnail = (
-            f"https://covers.openlibrary.org/b/id/{cover_id}-M.jpg"
-            if cover_id
-            else None
-        )
+        thumbnail = _COVER_URL(cover_id) if cover_id else None
 
         # Determine source type
         ebook_access = doc.get("ebook_access", "")
@@ -82,7 +92,7 @@ async def search_openlibrary(request: BaseSearchRequest):
         )
 
         results.append(
-            SearchResult(
+            dict(
                 title=doc.get("title", ""),
                 url=book_url,
                 snippet=snippet or "No description available",
@@ -92,7 +102,7 @@ async def search_openlibrary(request: BaseSearchRequest):
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
         query=search_query,
     )
@@ -1,22 +1,34 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+from functools import lru_cache
+import asyncio
 import httpx
+import orjson
 from typing import Optional
 import time
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
+from app.services.search_cache import cached_search
 from app.models.search import (
     UniCourtSearchRequest,
     SearchResponse,
     SearchResult,
-    SearchResultMetadata,
     SourceType,
 )
 
 router = APIRouter()
 
-# Token cache
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
+# Token cache; the lock makes refresh a singleflight so concurrent
+# requests with an expired token don't all call /generateNewToken
 _cached_token: Optional[str] = None
 _token_expiry: Optional[float] = None
+_token_lock = asyncio.Lock()
 
 UNICOURT_BASE_URL = "https://enterpriseapi.unicourt.com"
 
@@ -30,11 +42,16 @@ async def get_access_token() -> Optional[str]:
     if not settings.unicourt_client_id or not settings.unicourt_client_secret:
         return None
 
-    # Return cached token if still valid
+    # Return cached token if still valid (fast path without the lock)
     if _cached_token and _token_expiry and time.time() < _token_expiry:
         return _cached_token
 
-    async with httpx.AsyncClient() as client:
+    async with _token_lock:
+        # Another request may have refreshed while we waited on the lock
+        if _cached_token and _token_expiry and time.time() < _token_expiry:
+            return _cached_token
+
+        client = get_http_client()
         response = await client.post(
             f"{UNICOURT_BASE_URL}/generateNewToken",
             json={
@@ -46,7 +63,7 @@ async def get_access_token() -> Optional[str]:
         if response.status_code != 200:
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
         _cached_token = data.get("accessToken") or data.get("access_token")
         # Refresh token every 24 hours
         _token_expiry = time.time() + 24 * 60 * 60
@@ -55,52 +72,79 @@ async def get_access_token() -> Optional[str]:
 
 
 def build_query(params: UniCourtSearchRequest) -> str:
-    """Build UniCourt query string from parameters."""
+    """Build UniCourt query string from parameters (memoized)."""
+    return _build_query_cached(
+        params.query,
+        params.state,
+        params.case_type,
+        params.party_name,
+        params.attorney_name,
+        params.judge_name,
+        params.case_number,
+        params.date_from,
+        params.date_to,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _build_query_cached(
+    query: Optional[str],
+    state: Optional[str],
+    case_type: Optional[str],
+    party_name: Optional[str],
+    attorney_name: Optional[str],
+    judge_name: Optional[str],
+    case_number: Optional[str],
+    date_from: Optional[str],
+    date_to: Optional[str],
+) -> str:
+    """Assemble the Lucene query string; repeat searches hit the cache."""
     query_parts = []
 
     # Main search query
-    if params.query:
-        if ":" in params.query:
-            query_parts.append(params.query)
+    if query:
+        if ":" in query:
+            query_parts.append(query)
         else:
             query_parts.append(
-                f"(caseName:({params.query}) OR DocketEntry:({params.query}))"
+                f"(caseName:({query}) OR DocketEntry:({query}))"
             )
 
     # State/Jurisdiction filter
-    if params.state:
-        query_parts.append(f'(JurisdictionGeo:(state:(name:"{params.state}")))')
+    if state:
+        query_parts.append(f'(JurisdictionGeo:(state:(name:"{state}")))')
 
     # Case type filter
-    if params.case_type:
-        query_parts.append(f'(CaseType:(name:"{params.case_type}"))')
+    if case_type:
+        query_parts.append(f'(CaseType:(name:"{case_type}"))')
 
     # Party name
-    if params.party_name:
-        query_parts.append(f'(Party:(name:"{params.party_name}"))')
+    if party_name:
+        query_parts.append(f'(Party:(name:"{party_name}"))')
 
     # Attorney name
-    if params.attorney_name:
-        query_parts.append(f'(Attorney:(name:"{params.attorney_name}"))')
+    if attorney_name:
+        query_parts.append(f'(Attorney:(name:"{attorney_name}"))')
 
     # Judge name
-    if params.judge_name:
-        query_parts.append(f'(Judge:(name:"{params.judge_name}"))')
+    if judge_name:
+        query_parts.append(f'(Judge:(name:"{judge_name}"))')
 
     # Case number
-    if params.case_number:
-        query_parts.append(f'(caseNumber:"{params.case_number}")')
+    if case_number:
+        query_parts.append(f'(caseNumber:"{case_number}")')
 
     # Date range
-    if params.date_from:
-        query_parts.append(f"(filedDate:[{params.date_from} TO *])")
-    if params.date_to:
-        query_parts.append(f"(filedDate:[* TO {params.date_to}])")
+    if date_from:
+        query_parts.append(f"(filedDate:[{date_from} TO *])")
+    if date_to:
+        query_parts.append(f"(filedDate:[* TO {date_to}])")
 
     return " AND ".join(query_parts)
 
 
 @router.post("", response_model=SearchResponse)
+@cached_search("unicourt", ttl=600)
 async def search_unicourt(request: UniCourtSearchRequest):
     """Search UniCourt for court cases."""
     settings = get_settings()
@@ -135,23 +179,23 @@ async def search_unicourt(request: UniCourtSearchRequest):
         "order": "desc",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{UNICOURT_BASE_URL}/caseSearch",
-            params=params,
-            headers={
-                "Authorization": f"Bearer {access_token}",
-                "Content-Type": "application/json",
-            },
-        )
+    client = get_http_client()
+    response = await client.get(
+        f"{UNICOURT_BASE_URL}/caseSearch",
+        params=params,
+        headers={
+            "Authorization": f"Bearer {access_token}",
+            "Content-Type": "application/json",
+        },
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"UniCourt search failed: {response.text}",
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"UniCourt search failed: {response.text}",
+        )
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
     # Transform results
     results = []
@@ -177,7 +221,7 @@ async def search_unicourt(request: UniCourtSearchRequest):
             snippet = snippet[:297] + "..."
 
         results.append(
-            SearchResult(
+            dict(
                 title=item.get("caseName")
                 or item.get("caseTitle")
                 or "Unknown Case",
@@ -185,7 +229,7 @@ async def search_unicourt(request: UniCourtSearchRequest):
                 or f"https://unicourt.com/case/{item.get('caseId', '')}",
                 snippet=snippet or "No additional details available",
                 source_type=SourceType.DOCUMENT,
-                metadata=SearchResultMetadata(
+                metadata=dict(
                     case_id=item.get("caseId"),
                     case_number=item.get("caseNumber"),
                     court=item.get("courtName"),
@@ -198,24 +242,35 @@ async def search_unicourt(request: UniCourtSearchRequest):
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
         total=data.get("totalCount") or data.get("totalResults"),
         query=search_query,
     )
 
 
+# Only two status payloads are possible and configuration is fixed for
+# the process lifetime, so serialize both once and replay the bytes
+_STATUS_RESPONSES = {
+    configured: Response(
+        content=orjson.dumps(
+            {
+                "configured": configured,
+                "message": "UniCourt API is configured"
+                if configured
+                else "Add UNICOURT_CLIENT_ID and UNICOURT_CLIENT_SECRET to .env",
+            }
+        ),
+        media_type="application/json",
+    )
+    for configured in (True, False)
+}
+
+
 @router.get("/status")
 async def unicourt_status():
     """Check UniCourt configuration status."""
     settings = get_settings()
-    configured = bool(
-        settings.unicourt_client_id and settings.unicourt_client_secret
-    )
-
-    return {
-        "configured": configured,
-        "message": "UniCourt API is configured"
-        if configured
-        else "Add UNICOURT_CLIENT_ID and UNICOURT_CLIENT_SECRET to .env",
-    }
+    return _STATUS_RESPONSES[
+        bool(settings.unicourt_client_id and settings.unicourt_client_secret)
+    ]
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 import httpx
+import orjson
 
 from app.config import get_settings
+from app.services.http_client import get_http_client
+from app.services.search_cache import cached_search
 from app.models.search import (
     BaseSearchRequest,
     SearchResponse,
@@ -11,8 +15,13 @@ from app.models.search import (
 
 router = APIRouter()
 
+# Validating all results in one TypeAdapter pass batches the pydantic-core
+# work instead of paying per-item model construction in the loop
+_RESULTS_ADAPTER = TypeAdapter(list[SearchResult])
+
 
 @router.post("", response_model=SearchResponse)
+@cached_search("youtube", ttl=300)
 async def search_youtube(request: BaseSearchRequest):
     """Search YouTube videos."""
     settings = get_settings()
@@ -35,21 +44,23 @@ async def search_youtube(request: BaseSearchRequest):
         "order": "relevance",
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            "https://www.googleapis.com/youtube/v3/search", params=params
-        )
+    client = get_http_client()
+    response = await client.get(
+        "https://www.googleapis.com/youtube/v3/search", params=params
+    )
 
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"YouTube API error: {response.text}",
-            )
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"YouTube API error: {response.text}",
+        )
 
-        data = response.json()
+    data = orjson.loads(response.content)
 
-    # Transform results
+    # Transform results; bind the append method once so the loop body
+    # skips the repeated attribute lookup
     results = []
+    append = results.append
     for item in data.get("items", []):
         snippet = item.get("snippet", {})
         video_id = item.get("id", {}).get("videoId", "")
@@ -62,8 +73,8 @@ async def search_youtube(request: BaseSearchRequest):
             or thumbnails.get("default", {}).get("url")
         )
 
-        results.append(
-            SearchResult(
+        append(
+            dict(
                 title=snippet.get("title", ""),
                 url=f"https://www.youtube.com/watch?v={video_id}",
                 snippet=snippet.get("description"),
@@ -73,7 +84,7 @@ async def search_youtube(request: BaseSearchRequest):
         )
 
     return SearchResponse(
-        results=results,
+        results=_RESULTS_ADAPTER.validate_python(results),
         count=len(results),
         query=search_query,
     )
@@ -1,50 +1,154 @@
 """AI service helpers for embeddings, chat completion, and text processing."""
+import asyncio
+import hashlib
+import os
+import random
 import re
 import httpx
-from typing import List, Optional
+import orjson
+from collections import OrderedDict
+from functools import lru_cache
+from html import unescape
+from typing import Iterator, List, Optional
 from app.config import get_settings
 
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:  # pragma: no cover - regex fallback covers it
+    _HTMLParser = None
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - heuristic fallback covers it
+    tiktoken = None
+
 settings = get_settings()
 
 
+@lru_cache(maxsize=1)
+def get_ai_http_client() -> httpx.AsyncClient:
+    """Shared pooled client for OpenAI/Gemini/Jina calls.
+
+    Opening a fresh AsyncClient per call paid a TLS handshake on every
+    request; one pooled HTTP/2 client amortizes connection setup across
+    all providers for the process lifetime. Closed at lifespan shutdown.
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
+
+
+# Sentence boundaries tried in order when splitting chunks
+_SENTENCE_SEPARATORS = (". ", ".\n", "? ", "?\n", "! ", "!\n")
+
+
 # Text chunking
-def chunk_text(
+def iter_chunks(
     text: str,
     chunk_size: int = 1000,
     overlap: int = 100
-) -> List[str]:
-    """Split text into overlapping chunks."""
-    if not text or len(text) < chunk_size:
-        return [text] if text else []
+) -> Iterator[str]:
+    """Yield overlapping chunks lazily.
+
+    Streaming callers (batched embedders) keep only the current window
+    of chunks alive instead of every slice of a large document at once.
+    """
+    if not text:
+        return
+    if len(text) < chunk_size:
+        yield text
+        return
 
-    chunks = []
     start = 0
+    length = len(text)
+    half = chunk_size // 2
 
-    while start < len(text):
+    while start < length:
         end = start + chunk_size
 
         # Try to break at sentence boundary
-        if end < len(text):
-            # Look for sentence end near chunk boundary
-            for sep in [". ", ".\n", "? ", "?\n", "! ", "!\n"]:
-                last_sep = text[start:end].rfind(sep)
-                if last_sep > chunk_size // 2:
-                    end = start + last_sep + len(sep)
+        if end < length:
+            # Search the original string with offsets - rfind scans in C
+            # without allocating a per-separator slice copy
+            for sep in _SENTENCE_SEPARATORS:
+                last_sep = text.rfind(sep, start, end)
+                if last_sep - start > half:
+                    end = last_sep + len(sep)
                     break
 
         chunk = text[start:end].strip()
         if chunk:
-            chunks.append(chunk)
+            yield chunk
 
         start = end - overlap
 
-    return chunks
 
+def chunk_text(
+    text: str,
+    chunk_size: int = 1000,
+    overlap: int = 100
+) -> List[str]:
+    """Split text into overlapping chunks (materialized list)."""
+    return list(iter_chunks(text, chunk_size, overlap))
+
+
+# Token counting
+@lru_cache(maxsize=1)
+def _get_token_encoder():
+    """cl100k_base encoder, or None when unavailable.
 
-# Token counting (approximate)
+    tiktoken fetches its BPE data on first use; offline environments
+    (or a missing install) fall back to the chars//4 heuristic instead
+    of failing the request.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
 def count_tokens(text: str) -> int:
-    """Estimate token count (rough approximation: ~4 chars per token)."""
-    return len(text) // 4
+    """Count tokens with the real tokenizer (heuristic fallback)."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+def count_tokens_batch(texts: List[str]) -> List[int]:
+    """Count tokens for many texts in one Rust-parallel batch encode."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return [len(t) // 4 for t in texts]
+    return [
+        len(tokens)
+        for tokens in encoder.encode_batch(
+            texts, num_threads=os.cpu_count() or 1, disallowed_special=()
+        )
+    ]
+
+
+# Cleaning patterns compiled once at import - clean_content runs per
+# request and often in tight batches
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"https?://\S+")
+_SPACES_RE = re.compile(r"[ \t]+")
+_EXTRA_NEWLINES_RE = re.compile(r"\n{3,}")
+_HEADING_RE = re.compile(r"\n(#{1,6})\s*")
+_LIST_RE = re.compile(r"\n([-*])\s+")
+
+# Space runs and newline runs never create each other, so the two
+# whitespace passes fuse into one scan with a dispatching callback
+_WS_FUSED_RE = re.compile(r"([ \t]+)|\n{3,}")
+
+
+def _collapse_whitespace(match: re.Match) -> str:
+    return " " if match.group(1) else "\n\n"
 
 
 # Text cleaning
@@ -56,18 +160,23 @@ def clean_content(text: str, options: Optional[dict] = None) -> str:
     opts = options or {}
     cleaned = text
 
+    # Each pass is gated on a C-level substring probe: text that cannot
+    # contain a match skips the regex engine's full scan and rewrite
+
     # Remove HTML tags
-    if opts.get("remove_html", True):
-        cleaned = re.sub(r"<[^>]+>", " ", cleaned)
+    if opts.get("remove_html", True) and "<" in cleaned:
+        cleaned = _HTML_TAG_RE.sub(" ", cleaned)
 
     # Remove URLs (optional, disabled by default for legal docs)
-    if opts.get("remove_urls", False):
-        cleaned = re.sub(r"https?://\S+", "", cleaned)
+    if opts.get("remove_urls", False) and "http" in cleaned:
+        cleaned = _URL_RE.sub("", cleaned)
 
-    # Normalize whitespace
-    if opts.get("normalize_whitespace", True):
-        cleaned = re.sub(r"[ \t]+", " ", cleaned)
-        cleaned = re.sub(r"\n{3,}", "\n\n", cleaned)
+    # Normalize whitespace (single fused scan); lone spaces collapse to
+    # themselves, so only tabs, space runs or newline runs need the pass
+    if opts.get("normalize_whitespace", True) and (
+        "\t" in cleaned or "  " in cleaned or "\n\n\n" in cleaned
+    ):
+        cleaned = _WS_FUSED_RE.sub(_collapse_whitespace, cleaned)
 
     # Remove short lines (optional)
     if opts.get("remove_short_lines", False):
@@ -81,13 +190,69 @@ def clean_content(text: str, options: Optional[dict] = None) -> str:
     # Normalize markdown (optional)
     if opts.get("normalize_markdown", True):
         # Fix heading spacing
-        cleaned = re.sub(r"\n(#{1,6})\s*", r"\n\n\1 ", cleaned)
+        if "\n#" in cleaned:
+            cleaned = _HEADING_RE.sub(r"\n\n\1 ", cleaned)
         # Fix list spacing
-        cleaned = re.sub(r"\n([-*])\s+", r"\n\1 ", cleaned)
+        if "\n-" in cleaned or "\n*" in cleaned:
+            cleaned = _LIST_RE.sub(r"\n\1 ", cleaned)
 
     return cleaned.strip()
 
 
+# Below this size the process-pool round trip (pickle + IPC) costs more
+# than running the work inline; mirrors the clean router's threshold
+_BATCH_OFFLOAD_THRESHOLD = 20_000
+
+
+async def _map_offloaded(func, items: List[str], executor, *args) -> list:
+    """Apply a CPU-bound func to many inputs, fanning out to a pool.
+
+    Large inputs are submitted to the executor so they run on separate
+    cores instead of serially under the GIL; small ones run inline where
+    the pickle/IPC round trip would dominate. Order is preserved.
+    """
+    if executor is None:
+        return [func(item, *args) for item in items]
+    loop = asyncio.get_running_loop()
+    results: list = [None] * len(items)
+    pending = []
+    for index, item in enumerate(items):
+        if len(item) < _BATCH_OFFLOAD_THRESHOLD:
+            results[index] = func(item, *args)
+        else:
+            pending.append(
+                (index, loop.run_in_executor(executor, func, item, *args))
+            )
+    for index, future in pending:
+        results[index] = await future
+    return results
+
+
+async def clean_content_batch(
+    texts: List[str],
+    options: Optional[dict] = None,
+    executor=None,
+) -> List[str]:
+    """Clean many documents concurrently.
+
+    Pass the lifespan process pool (app.state.clean_pool) as executor to
+    spread large documents across cores; without one the batch runs
+    inline.
+    """
+    # Plain dict because MappingProxyType doesn't pickle
+    return await _map_offloaded(
+        clean_content, texts, executor, dict(options) if options else None
+    )
+
+
+async def extract_with_readability_batch(
+    htmls: List[str],
+    executor=None,
+) -> List[dict]:
+    """Extract main content from many HTML documents concurrently."""
+    return await _map_offloaded(extract_with_readability, htmls, executor)
+
+
 def get_cleaning_stats(original: str, cleaned: str) -> dict:
     """Calculate cleaning statistics."""
     original_len = len(original)
@@ -101,36 +266,155 @@ def get_cleaning_stats(original: str, cleaned: str) -> dict:
     }
 
 
-# OpenAI embeddings
-async def generate_embedding(text: str) -> List[float]:
-    """Generate embedding for a single text using OpenAI."""
-    if not settings.openai_api_key:
-        raise ValueError("OpenAI API key not configured")
+# Coalescing batcher: per-chunk generate_embedding calls that arrive
+# within the window are merged into one /embeddings request instead of
+# paying a full HTTPS round trip each
+_EMBED_COALESCE_MAX = 64
+_EMBED_COALESCE_WINDOW = 0.01
+_embed_queue: Optional[asyncio.Queue] = None
+_embed_batcher: Optional[asyncio.Task] = None
+
+
+async def _drain_embed_queue() -> None:
+    """Collect queued (text, future) pairs and embed them in batches."""
+    while True:
+        items = [await _embed_queue.get()]
+        # Brief window so concurrent callers can pile onto this batch
+        while len(items) < _EMBED_COALESCE_MAX:
+            try:
+                items.append(
+                    await asyncio.wait_for(
+                        _embed_queue.get(), _EMBED_COALESCE_WINDOW
+                    )
+                )
+            except asyncio.TimeoutError:
+                break
+        try:
+            embeddings = await _post_embeddings([text for text, _ in items])
+        except Exception as exc:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exc)
+            continue
+        for (_, future), embedding in zip(items, embeddings):
+            if not future.done():
+                future.set_result(embedding)
+
+
+def _ensure_embed_batcher() -> asyncio.Queue:
+    """Start (or restart on a new loop) the background batcher task."""
+    global _embed_queue, _embed_batcher
+    loop = asyncio.get_running_loop()
+    if (
+        _embed_batcher is None
+        or _embed_batcher.done()
+        or _embed_batcher.get_loop() is not loop
+    ):
+        _embed_queue = asyncio.Queue()
+        _embed_batcher = loop.create_task(_drain_embed_queue())
+    return _embed_queue
+
+
+def cancel_embed_batcher() -> None:
+    """Stop the batcher task; called at lifespan shutdown."""
+    global _embed_batcher
+    if _embed_batcher is not None and not _embed_batcher.done():
+        _embed_batcher.cancel()
+    _embed_batcher = None
 
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/embeddings",
-            headers={
-                "Authorization": f"Bearer {settings.openai_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": "text-embedding-3-small",
-                "input": text,
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data["data"][0]["embedding"]
 
+# OpenAI embeddings
+async def generate_embedding(text: str) -> List[float]:
+    """Generate embedding for a single text using OpenAI.
 
-async def generate_embeddings(texts: List[str]) -> List[List[float]]:
-    """Generate embeddings for multiple texts."""
+    Requests are funneled through the coalescing batcher, so tight
+    per-chunk loops share upstream calls transparently.
+    """
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not configured")
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
+    queue = _ensure_embed_batcher()
+    future = asyncio.get_running_loop().create_future()
+    queue.put_nowait((text, future))
+    return await future
+
+
+# OpenAI caps embeddings requests at 2048 inputs; lists beyond the cap
+# are windowed and dispatched concurrently
+_EMBED_BATCH_ITEM_CAP = 2048
+
+
+# Transient statuses worth retrying; validation errors (e.g. the 400
+# the embed router bisects on) propagate immediately
+_RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+_RETRY_MAX_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 30.0
+
+
+async def _post_with_retry(url: str, **kwargs) -> httpx.Response:
+    """POST via the shared client, backing off on transient failures.
+
+    Honors Retry-After when the API provides one, otherwise doubles the
+    delay per attempt with jitter so concurrent batches don't all
+    re-converge on the same instant after a 429.
+    """
+    client = get_ai_http_client()
+    for attempt in range(_RETRY_MAX_ATTEMPTS):
+        response = await client.post(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES:
+            response.raise_for_status()
+            return response
+        if attempt == _RETRY_MAX_ATTEMPTS - 1:
+            response.raise_for_status()
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = min(float(retry_after), _RETRY_MAX_DELAY)
+        else:
+            delay = min(_RETRY_BASE_DELAY * 2 ** attempt, _RETRY_MAX_DELAY)
+        await asyncio.sleep(delay + random.uniform(0, delay / 4))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+# Content-addressed embedding cache: the model is deterministic, so
+# ingestion re-runs and retries skip the network entirely on a hit.
+# Keyed by a blake2b digest rather than the full text to bound key size.
+_EMBED_CACHE_MAX = 8192
+_embed_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+
+
+def _embed_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
+def _embed_cache_get(key: bytes) -> Optional[List[float]]:
+    value = _embed_cache.get(key)
+    if value is not None:
+        _embed_cache.move_to_end(key)
+    return value
+
+
+def _embed_cache_put(key: bytes, value: List[float]) -> None:
+    _embed_cache[key] = value
+    _embed_cache.move_to_end(key)
+    if len(_embed_cache) > _EMBED_CACHE_MAX:
+        _embed_cache.popitem(last=False)
+
+
+async def _post_embeddings(texts: List[str]) -> List[List[float]]:
+    """Embed texts, serving cached vectors and requesting only misses."""
+    keys = [_embed_cache_key(text) for text in texts]
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    misses = []
+    for index, key in enumerate(keys):
+        cached = _embed_cache_get(key)
+        if cached is not None:
+            results[index] = cached
+        else:
+            misses.append(index)
+
+    if misses:
+        response = await _post_with_retry(
             "https://api.openai.com/v1/embeddings",
             headers={
                 "Authorization": f"Bearer {settings.openai_api_key}",
@@ -138,14 +422,56 @@ async def generate_embeddings(texts: List[str]) -> List[List[float]]:
             },
             json={
                 "model": "text-embedding-3-small",
-                "input": texts,
+                "input": [texts[i] for i in misses],
             }
         )
-        response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         # Sort by index to maintain order
         sorted_data = sorted(data["data"], key=lambda x: x["index"])
-        return [item["embedding"] for item in sorted_data]
+        for index, item in zip(misses, sorted_data):
+            embedding = item["embedding"]
+            results[index] = embedding
+            _embed_cache_put(keys[index], embedding)
+
+    return results
+
+
+async def generate_embeddings(
+    texts: List[str],
+    batch_size: int = _EMBED_BATCH_ITEM_CAP,
+    max_concurrency: int = 8,
+) -> List[List[float]]:
+    """Generate embeddings for multiple texts.
+
+    Lists up to batch_size go out as a single request, so callers doing
+    their own token-budgeted packing (the embed router) are untouched.
+    Larger lists are length-sorted into windows of similar-sized inputs
+    and dispatched concurrently under a semaphore, then reassembled in
+    the original order.
+    """
+    if not settings.openai_api_key:
+        raise ValueError("OpenAI API key not configured")
+    if not texts:
+        return []
+
+    if len(texts) <= batch_size:
+        return await _post_embeddings(texts)
+
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results: List[Optional[List[float]]] = [None] * len(texts)
+
+    async def _run(window: List[int]) -> None:
+        async with semaphore:
+            embeddings = await _post_embeddings([texts[i] for i in window])
+        for index, embedding in zip(window, embeddings):
+            results[index] = embedding
+
+    await asyncio.gather(*(
+        _run(order[i:i + batch_size])
+        for i in range(0, len(order), batch_size)
+    ))
+    return results
 
 
 # OpenAI chat completion
@@ -159,23 +485,59 @@ async def chat_completion(
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not configured")
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Authorization": f"Bearer {settings.openai_api_key}",
-                "Content-Type": "application/json",
-            },
-            json={
-                "model": model,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            }
-        )
+    response = await _post_with_retry(
+        "https://api.openai.com/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {settings.openai_api_key}",
+            "Content-Type": "application/json",
+        },
+        json={
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+    )
+    data = orjson.loads(response.content)
+    return data["choices"][0]["message"]["content"]
+
+
+async def chat_completion_stream(
+    messages: List[dict],
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.7,
+    max_tokens: int = 4096,
+):
+    """Stream chat completion deltas from OpenAI as they are generated."""
+    if not settings.openai_api_key:
+        raise ValueError("OpenAI API key not configured")
+
+    async with get_ai_http_client().stream(
+        "POST",
+        "https://api.openai.com/v1/chat/completions",
+        headers={
+            "Authorization": f"Bearer {settings.openai_api_key}",
+            "Content-Type": "application/json",
+        },
+        json={
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "stream": True,
+        }
+    ) as response:
         response.raise_for_status()
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            payload = line[6:]
+            if payload == "[DONE]":
+                break
+            data = orjson.loads(payload)
+            delta = data["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
 
 
 # Gemini chat completion
@@ -193,30 +555,65 @@ async def gemini_chat_completion(
     if context:
         full_prompt = f"Context:\n{context}\n\n---\n\n{prompt}"
 
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await client.post(
-            f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent",
-            params={"key": settings.gemini_api_key},
-            json={
-                "contents": [{"parts": [{"text": full_prompt}]}],
-                "generationConfig": {
-                    "temperature": temperature,
-                    "maxOutputTokens": 8192,
-                }
+    response = await _post_with_retry(
+        f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent",
+        params={"key": settings.gemini_api_key},
+        json={
+            "contents": [{"parts": [{"text": full_prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": 8192,
             }
-        )
+        }
+    )
+    data = orjson.loads(response.content)
+    return data["candidates"][0]["content"]["parts"][0]["text"]
+
+
+async def gemini_chat_completion_stream(
+    prompt: str,
+    context: Optional[str] = None,
+    model: str = "gemini-2.0-flash-exp",
+    temperature: float = 0.7,
+):
+    """Stream completion text from Google Gemini as it is generated."""
+    if not settings.gemini_api_key:
+        raise ValueError("Gemini API key not configured")
+
+    full_prompt = prompt
+    if context:
+        full_prompt = f"Context:\n{context}\n\n---\n\n{prompt}"
+
+    async with get_ai_http_client().stream(
+        "POST",
+        f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent",
+        params={"key": settings.gemini_api_key, "alt": "sse"},
+        json={
+            "contents": [{"parts": [{"text": full_prompt}]}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": 8192,
+            }
+        }
+    ) as response:
         response.raise_for_status()
-        data = response.json()
-        return data["candidates"][0]["content"]["parts"][0]["text"]
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = orjson.loads(line[6:])
+            for candidate in data.get("candidates", []):
+                for part in candidate.get("content", {}).get("parts", []):
+                    if part.get("text"):
+                        yield part["text"]
 
 
 # RAG prompt builders
 def build_rag_prompt(question: str, sources: List[dict]) -> str:
     """Build RAG prompt with sources context."""
-    context = "\n\n".join([
+    context = "\n\n".join(
         f"Source: {s.get('source', 'Unknown')}\n{s.get('text', '')}"
         for s in sources
-    ])
+    )
 
     return f"""You are a legal research assistant. Answer the following question based on the provided sources.
 
@@ -234,10 +631,10 @@ Instructions:
 
 def build_summarize_prompt(chunks: List[dict], style: str = "detailed") -> str:
     """Build summarization prompt."""
-    context = "\n\n".join([
+    context = "\n\n".join(
         f"From '{c.get('source', 'Unknown')}':\n{c.get('text', '')}"
         for c in chunks
-    ])
+    )
 
     style_instructions = {
         "brief": "Provide a concise 2-3 paragraph summary.",
@@ -260,76 +657,186 @@ Focus on:
 
 # Jina Reader for URL cleaning
 async def clean_with_jina(url: str) -> dict:
-    """Clean URL content using Jina Reader API."""
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.get(
-            f"https://r.jina.ai/{url}",
-            headers={"Accept": "text/plain"}
-        )
+    """Clean URL content using Jina Reader API.
+
+    Streams the body line by line - the title comes from the first line
+    without buffering the full response and re-splitting it, so large
+    articles are assembled once instead of held twice.
+    """
+    first_line: Optional[str] = None
+    lines = []
+    async with get_ai_http_client().stream(
+        "GET",
+        f"https://r.jina.ai/{url}",
+        headers={"Accept": "text/plain"},
+        timeout=30.0,
+    ) as response:
         response.raise_for_status()
-        text = response.text
+        async for line in response.aiter_lines():
+            if first_line is None:
+                first_line = line
+            lines.append(line)
+
+    text = "\n".join(lines)
 
     # Extract title from first heading
     title = None
-    lines = text.split("\n")
-    if lines and lines[0].startswith("# "):
-        title = lines[0].replace("# ", "").strip()
+    if first_line is not None and first_line.startswith("# "):
+        title = first_line[2:].strip()
 
     return {"text": text, "title": title}
 
 
+# Readability patterns compiled once at import - extraction runs on
+# full pages, so per-call compile-cache lookups add up. DOTALL replaces
+# the [\s\S] idiom.
+_SCRIPT_RE = re.compile(r"<script[^>]*>.*?</script>", re.I | re.S)
+_STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.I | re.S)
+_NOSCRIPT_RE = re.compile(r"<noscript[^>]*>.*?</noscript>", re.I | re.S)
+_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_TITLE_RE = re.compile(r"<title[^>]*>([^<]*)</title>", re.I)
+_BOILERPLATE_RES = tuple(
+    re.compile(rf"<{tag}[^>]*>.*?</{tag}>", re.I | re.S)
+    for tag in ("header", "footer", "nav", "aside")
+)
+_ARTICLE_RE = re.compile(r"<article[^>]*>(.*?)</article>", re.I | re.S)
+_MAIN_RE = re.compile(r"<main[^>]*>(.*?)</main>", re.I | re.S)
+# The nine heading/paragraph/list conversions plus the generic tag
+# strip all consume disjoint <...> spans and none of the replacements
+# reintroduces "<", so they fuse into one alternation with a callback
+# (specific tags before the catch-all) instead of ten full rewrites
+_TAG_MARKDOWN_RE = re.compile(
+    r"<(?P<open>h1|h2|h3|p|li)[^>]*>"
+    r"|(?P<newline></h[1-6]>|<br\s*/?>)"
+    r"|<[^>]+>",
+    re.I,
+)
+_OPEN_TAG_MARKDOWN = {
+    "h1": "\n\n# ",
+    "h2": "\n\n## ",
+    "h3": "\n\n### ",
+    "p": "\n\n",
+    "li": "\n- ",
+}
+
+
+def _tag_to_markdown(match: re.Match) -> str:
+    open_tag = match.group("open")
+    if open_tag:
+        return _OPEN_TAG_MARKDOWN[open_tag.lower()]
+    if match.group("newline"):
+        return "\n"
+    return ""
+
+
+# Extract-side whitespace passes fused the same way as clean_content's
+_EXTRACT_WS_RE = re.compile(r"([ \t]+)|\n{4,}")
+
+
+def _collapse_extract_whitespace(match: re.Match) -> str:
+    return " " if match.group(1) else "\n\n\n"
+
+
+# Boilerplate containers dropped before content extraction
+_STRIP_TAGS = ["script", "style", "noscript", "header", "footer", "nav", "aside"]
+
+# h4-h6 carry no markdown prefix (matching the regex path) but still
+# terminate with a newline
+_HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+
+def _emit_markdown(node, parts: list) -> None:
+    """Walk a selectolax subtree appending markdown-ish text parts."""
+    for child in node.iter(include_text=True):
+        tag = child.tag
+        if tag == "-text":
+            parts.append(child.text(deep=False))
+            continue
+        prefix = _OPEN_TAG_MARKDOWN.get(tag)
+        if prefix:
+            parts.append(prefix)
+        elif tag == "br":
+            parts.append("\n")
+        _emit_markdown(child, parts)
+        if tag in _HEADING_TAGS:
+            parts.append("\n")
+
+
+def _extract_with_selectolax(html) -> dict:
+    """Extract via the Modest C engine - one linear parse of the page."""
+    # The parser takes bytes directly, so byte callers skip a full-page
+    # UTF-8 decode; only the extracted text comes back as str
+    tree = _HTMLParser(html)
+    tree.strip_tags(_STRIP_TAGS)
+
+    title_node = tree.css_first("title")
+    title = title_node.text().strip() if title_node else None
+
+    root = tree.css_first("article") or tree.css_first("main") or tree.body
+    if root is None:
+        return {"text": "", "title": title}
+
+    # Entities are decoded by the parser, so no replace chain is needed
+    parts: list = []
+    _emit_markdown(root, parts)
+    text = _EXTRACT_WS_RE.sub(_collapse_extract_whitespace, "".join(parts))
+
+    return {"text": text.strip(), "title": title}
+
+
 # Readability-style HTML extraction
-def extract_with_readability(html: str) -> dict:
-    """Extract main content from HTML."""
+def extract_with_readability(html) -> dict:
+    """Extract main content from HTML (str or raw response bytes).
+
+    Parses with selectolax when available (C tokenizer, linear on
+    minified pages where the lazy regexes backtrack badly); falls back
+    to the regex pipeline otherwise. Callers holding undecoded bytes
+    (httpx response.content) can pass them straight through - the C
+    parser consumes bytes natively and only the extracted text is
+    decoded.
+    """
+    if _HTMLParser is not None:
+        return _extract_with_selectolax(html)
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    return _extract_with_regex(html)
+
+
+def _extract_with_regex(html: str) -> dict:
+    """Regex fallback used when selectolax is not installed."""
     # Remove scripts, styles, comments
     cleaned = html
-    cleaned = re.sub(r"<script[^>]*>[\s\S]*?</script>", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"<style[^>]*>[\s\S]*?</style>", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"<noscript[^>]*>[\s\S]*?</noscript>", "", cleaned, flags=re.I)
-    cleaned = re.sub(r"<!--[\s\S]*?-->", "", cleaned)
+    cleaned = _SCRIPT_RE.sub("", cleaned)
+    cleaned = _STYLE_RE.sub("", cleaned)
+    cleaned = _NOSCRIPT_RE.sub("", cleaned)
+    cleaned = _COMMENT_RE.sub("", cleaned)
 
     # Extract title
-    title_match = re.search(r"<title[^>]*>([^<]*)</title>", cleaned, re.I)
+    title_match = _TITLE_RE.search(cleaned)
     title = title_match.group(1).strip() if title_match else None
 
     # Remove boilerplate containers
-    for tag in ["header", "footer", "nav", "aside"]:
-        cleaned = re.sub(f"<{tag}[^>]*>[\\s\\S]*?</{tag}>", "", cleaned, flags=re.I)
+    for pattern in _BOILERPLATE_RES:
+        cleaned = pattern.sub("", cleaned)
 
     # Try to find main content
-    article_match = re.search(r"<article[^>]*>([\s\S]*?)</article>", cleaned, re.I)
-    main_match = re.search(r"<main[^>]*>([\s\S]*?)</main>", cleaned, re.I)
+    article_match = _ARTICLE_RE.search(cleaned)
+    main_match = _MAIN_RE.search(cleaned)
 
     if article_match:
         cleaned = article_match.group(1)
     elif main_match:
         cleaned = main_match.group(1)
 
-    # Convert HTML to text
-    text = cleaned
-    # Headings
-    text = re.sub(r"<h1[^>]*>", "\n\n# ", text, flags=re.I)
-    text = re.sub(r"<h2[^>]*>", "\n\n## ", text, flags=re.I)
-    text = re.sub(r"<h3[^>]*>", "\n\n### ", text, flags=re.I)
-    text = re.sub(r"</h[1-6]>", "\n", text, flags=re.I)
-    # Paragraphs
-    text = re.sub(r"<p[^>]*>", "\n\n", text, flags=re.I)
-    text = re.sub(r"</p>", "", text, flags=re.I)
-    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.I)
-    # Lists
-    text = re.sub(r"<li[^>]*>", "\n- ", text, flags=re.I)
-    text = re.sub(r"</li>", "", text, flags=re.I)
-    # Remove remaining tags
-    text = re.sub(r"<[^>]+>", "", text)
-    # Decode entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
-    text = text.replace("&quot;", '"')
-    text = text.replace("&#39;", "'")
-    # Clean whitespace
-    text = re.sub(r"\n{4,}", "\n\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
+    # Convert HTML to markdown-ish text in one fused scan: headings,
+    # paragraphs, breaks and list items get their replacements, every
+    # other tag is stripped
+    text = _TAG_MARKDOWN_RE.sub(_tag_to_markdown, cleaned)
+    # Decode entities in one C-level pass; also covers the named and
+    # numeric forms the old replace chain missed
+    if "&" in text:
+        text = unescape(text)
+    # Clean whitespace (single fused scan)
+    text = _EXTRACT_WS_RE.sub(_collapse_extract_whitespace, text)
 
     return {"text": text.strip(), "title": title}
@@ -0,0 +1,39 @@
+"""In-process TTL cache for hot lookups (query embeddings, match results).
+
+A single uvicorn worker serves this API, so a process-local cache gives the
+same hit profile as an external store without a network hop. Entries keep
+their expiry timestamp and are evicted lazily on access; `allow_stale` lets
+callers fall back to an expired entry when the upstream service errors.
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TTLCache:
+    """LRU-bounded cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """Return the cached value, or None when missing/expired.
+
+        With allow_stale=True an expired entry is still returned - used as a
+        fallback when the authoritative source is unavailable.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic() and not allow_stale:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,57 @@
+"""Bulk persistence for lr_embeddings rows via binary COPY.
+
+PostgREST inserts execute row-wise server-side; for resources that chunk
+into many rows, COPY ... FROM STDIN in binary format streams everything
+over one direct Postgres connection instead, and pgvector's adapter
+writes each embedding as a native vector rather than a 1536-float text
+literal. The direct path is used only when POSTGRES_DSN is configured;
+callers fall back to the PostgREST insert otherwise.
+"""
+from typing import Iterable, List, Tuple
+
+import psycopg
+from pgvector import Vector
+from pgvector.psycopg import register_vector
+from psycopg.types.json import Jsonb
+
+from app.config import get_settings
+
+# Below this many rows, the single PostgREST insert round-trip is cheaper
+# than opening a direct connection for COPY
+COPY_THRESHOLD = 1024
+
+_COPY_SQL = (
+    "COPY lr_embeddings "
+    "(resource_id, chunk_index, chunk_text, embedding, token_count, metadata) "
+    "FROM STDIN WITH (FORMAT BINARY)"
+)
+
+
+def copy_enabled() -> bool:
+    """True when a direct Postgres DSN is configured."""
+    return bool(get_settings().postgres_dsn)
+
+
+def copy_embedding_rows(
+    rows: Iterable[Tuple[str, int, str, List[float], int, dict]]
+) -> None:
+    """Stream embedding rows into lr_embeddings with binary COPY.
+
+    Each row is (resource_id, chunk_index, chunk_text, embedding,
+    token_count, metadata). Accepts any iterable - callers can hand over
+    a generator zipped from their column lists so no intermediate row
+    list is ever materialized. Blocking; run via asyncio.to_thread from
+    async handlers.
+    """
+    settings = get_settings()
+    with psycopg.connect(settings.postgres_dsn) as conn:
+        register_vector(conn)
+        with conn.cursor() as cur:
+            with cur.copy(_COPY_SQL) as copy:
+                copy.set_types(
+                    ["uuid", "int4", "text", "vector", "int4", "jsonb"]
+                )
+                for rid, idx, text, embedding, tokens, metadata in rows:
+                    copy.write_row(
+                        (rid, idx, text, Vector(embedding), tokens, Jsonb(metadata))
+                    )
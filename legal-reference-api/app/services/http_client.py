@@ -0,0 +1,93 @@
+"""Shared outbound HTTP client for the search routers.
+
+Every search endpoint used to open a fresh httpx.AsyncClient per request,
+paying the full TCP+TLS handshake for each upstream call. One pooled
+HTTP/2 client keeps connections warm across requests and lets combined
+search's parallel calls multiplex. Closed at lifespan shutdown.
+"""
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import httpx
+import ijson
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled client for upstream search APIs."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        headers={"User-Agent": "LegalReferenceLibrary/1.0"},
+    )
+
+
+async def stream_json_items(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    params: Optional[dict] = None,
+    headers: Optional[dict] = None,
+    items_prefix: str = "results.item",
+    total_prefix: Optional[str] = None,
+    limit: Optional[int] = None,
+) -> Tuple[List[dict], Optional[Any]]:
+    """Stream a JSON response, yielding item dicts as bytes arrive.
+
+    Large upstream payloads (CourtListener and LoC responses regularly
+    exceed 500KB) used to be buffered whole and decoded in one shot.
+    This parses incrementally with ijson while the body downloads, so
+    peak memory stays at one item rather than the full payload, and
+    with `limit` set the connection is dropped as soon as enough items
+    have arrived. `total_prefix` optionally captures a scalar (e.g. a
+    result count) from the same single parse pass.
+
+    Raises httpx.HTTPStatusError for non-200 responses, with the error
+    body already read.
+    """
+    items: List[dict] = []
+    total: Optional[Any] = None
+
+    async with client.stream("GET", url, params=params, headers=headers) as response:
+        if response.status_code != 200:
+            await response.aread()
+            response.raise_for_status()
+
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events)
+        builder: Optional[ijson.ObjectBuilder] = None
+        done = False
+
+        async for chunk in response.aiter_bytes():
+            try:
+                parser.send(chunk)
+            except StopIteration:
+                done = True
+
+            for prefix, event, value in events:
+                if builder is not None:
+                    builder.event(event, value)
+                    if event == "end_map" and prefix == items_prefix:
+                        items.append(builder.value)
+                        builder = None
+                        if limit is not None and len(items) >= limit:
+                            done = True
+                            break
+                elif prefix == items_prefix and event == "start_map":
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                elif total_prefix is not None and prefix == total_prefix:
+                    total = value
+            del events[:]
+
+            if done:
+                break
+
+        if not done:
+            try:
+                parser.close()
+            except ijson.common.IncompleteJSONError:
+                pass
+
+    return items, total
@@ -0,0 +1,76 @@
+"""Response cache for the search routers.
+
+Popular legal keywords repeat constantly, and every repeat burned
+upstream rate-limit budget and a full network round trip. Handlers are
+wrapped with a per-source TTL cache keyed by the request fields; slow-
+changing sources (Congress, LoC, OpenLibrary) keep entries longer than
+the fast-moving ones. On an upstream failure a stale entry is served
+instead of propagating the error. The cache is in-process (see
+services/cache.py) - one worker serves this API, so an external store
+would only add a network hop.
+
+Cache misses are additionally deduplicated in flight: when several
+concurrent requests miss on the same key (a popular query landing right
+after its entry expires), only the first one calls upstream and the rest
+await its result instead of stampeding the external API.
+"""
+import asyncio
+import functools
+
+from app.services.cache import TTLCache
+
+_search_cache = TTLCache(maxsize=2048)
+
+# In-flight upstream calls keyed like the cache; maps key -> Future
+_inflight: dict = {}
+
+
+def cached_search(source: str, ttl: float):
+    """Wrap a search handler with a TTL response cache for its source.
+
+    The cache key covers every field of the request model, so any filter
+    change is a distinct entry. Responses carrying an error field are not
+    cached. Applied between the route decorator and the handler so both
+    the POST route and combined search's direct calls share hits.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(request, *args, **kwargs):
+            key = (source,) + tuple(sorted(
+                (field, str(value))
+                for field, value in request.model_dump().items()
+            ))
+            cached = _search_cache.get(key)
+            if cached is not None:
+                return cached
+
+            # Singleflight: join an identical in-flight call instead of
+            # issuing a duplicate upstream request
+            pending = _inflight.get(key)
+            if pending is not None:
+                return await asyncio.shield(pending)
+
+            future = asyncio.get_running_loop().create_future()
+            _inflight[key] = future
+            try:
+                response = await func(request, *args, **kwargs)
+            except Exception as exc:
+                stale = _search_cache.get(key, allow_stale=True)
+                if stale is not None:
+                    future.set_result(stale)
+                    return stale
+                future.set_exception(exc)
+                # Waiters consume the exception; avoid the unretrieved-
+                # exception warning when there are none
+                future.exception()
+                raise
+            finally:
+                _inflight.pop(key, None)
+
+            if not getattr(response, "error", None):
+                _search_cache.set(key, response, ttl)
+            future.set_result(response)
+            return response
+
+        return wrapper
+    return decorator
@@ -0,0 +1,108 @@
+"""Async Supabase access - non-blocking PostgREST queries for async handlers.
+
+The supabase-py client is synchronous (requests-style blocking I/O), which
+stalls the event loop inside async FastAPI handlers. This thin wrapper talks
+to the PostgREST endpoints directly over a shared pooled httpx.AsyncClient,
+so a worker can service many concurrent requests while waiting on Supabase.
+"""
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import httpx
+import orjson
+
+from app.config import get_settings
+
+
+class AsyncSupabase:
+    """Thin async wrapper over the Supabase PostgREST REST API."""
+
+    def __init__(self, url: str, key: str):
+        self._client = httpx.AsyncClient(
+            base_url=f"{url.rstrip('/')}/rest/v1",
+            headers={
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+                "Content-Type": "application/json",
+                "Prefer": "return=representation",
+            },
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+
+    async def select(
+        self,
+        table: str,
+        columns: str = "*",
+        *,
+        eq: Optional[Tuple[str, Any]] = None,
+        in_: Optional[Tuple[str, List[Any]]] = None,
+        order: Optional[str] = None,
+        desc: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """SELECT rows, returning a list of dicts ([] when nothing matches)."""
+        params = {"select": columns}
+        if eq is not None:
+            params[eq[0]] = f"eq.{eq[1]}"
+        if in_ is not None:
+            params[in_[0]] = "in.({})".format(",".join(str(v) for v in in_[1]))
+        if order is not None:
+            params["order"] = f"{order}.desc" if desc else f"{order}.asc"
+        if limit is not None:
+            params["limit"] = str(limit)
+
+        response = await self._client.get(f"/{table}", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def insert(self, table: str, rows: Any) -> List[dict]:
+        """INSERT one dict or a list of dicts, returning the created rows.
+
+        The body is encoded with orjson (content=, not json=) so big batch
+        inserts - embedding payloads run to megabytes - don't pay for
+        stdlib json.dumps on the event loop; the client's default
+        Content-Type header already declares application/json.
+        """
+        response = await self._client.post(f"/{table}", content=orjson.dumps(rows))
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def update(
+        self, table: str, values: dict, *, eq: Tuple[str, Any]
+    ) -> List[dict]:
+        """UPDATE rows matching the eq filter, returning the updated rows."""
+        response = await self._client.patch(
+            f"/{table}",
+            content=orjson.dumps(values),
+            params={eq[0]: f"eq.{eq[1]}"},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def delete(self, table: str, *, eq: Tuple[str, Any]) -> None:
+        """DELETE rows matching the eq filter."""
+        response = await self._client.delete(
+            f"/{table}", params={eq[0]: f"eq.{eq[1]}"}
+        )
+        response.raise_for_status()
+
+    async def rpc(self, name: str, params: dict) -> Any:
+        """Call a Postgres function via the RPC endpoint."""
+        response = await self._client.post(
+            f"/rpc/{name}", content=orjson.dumps(params)
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+@lru_cache(maxsize=1)
+def get_async_supabase() -> AsyncSupabase:
+    """Get the shared async Supabase client singleton."""
+    settings = get_settings()
+    url = settings.supabase_db_pool_url or settings.supabase_url
+    return AsyncSupabase(url, settings.supabase_key)
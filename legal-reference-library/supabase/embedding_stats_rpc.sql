@@ -0,0 +1,31 @@
+-- =============================================
+-- EMBEDDING STATUS AGGREGATES
+-- =============================================
+-- The /ai/embed status endpoint used to pull every lr_embeddings row to
+-- count distinct resources in Python. These helpers push the aggregation
+-- into Postgres so one row (or one deduplicated id list) comes back
+-- instead of the whole table.
+
+CREATE OR REPLACE FUNCTION lr_embedding_stats()
+RETURNS TABLE (
+  total_embeddings bigint,
+  embedded_resources bigint
+)
+LANGUAGE sql STABLE
+AS $$
+  SELECT count(*), count(DISTINCT resource_id)
+  FROM lr_embeddings;
+$$;
+
+-- Distinct resource ids (from the given set) that have at least one
+-- embedding - used for per-category status without shipping duplicate
+-- chunk rows over the wire.
+CREATE OR REPLACE FUNCTION lr_embedded_resource_ids(ids uuid[])
+RETURNS TABLE (resource_id uuid)
+LANGUAGE sql STABLE
+AS $$
+  SELECT resource_id
+  FROM lr_embeddings
+  WHERE resource_id = ANY(ids)
+  GROUP BY resource_id;
+$$;
@@ -0,0 +1,50 @@
+-- =============================================
+-- MATCH_EMBEDDINGS: QUERY-TIME HNSW TUNING
+-- =============================================
+-- The HNSW index (idx_lr_embeddings_vector) ships with ef_search = 40,
+-- which caps the candidate list regardless of match_count. Scale the
+-- candidate list with the requested count so larger searches keep their
+-- recall; set_config(..., true) scopes the setting to this transaction.
+--
+-- Requires match_embeddings_join.sql (the 8-column return signature).
+
+CREATE OR REPLACE FUNCTION match_embeddings(
+  query_embedding vector(1536),
+  match_threshold float DEFAULT 0.7,
+  match_count int DEFAULT 10,
+  filter_resource_ids uuid[] DEFAULT NULL
+)
+RETURNS TABLE (
+  id uuid,
+  resource_id uuid,
+  chunk_index int,
+  chunk_text text,
+  similarity float,
+  metadata jsonb,
+  resource_title text,
+  resource_url text
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  PERFORM set_config('hnsw.ef_search', GREATEST(40, match_count * 4)::text, true);
+
+  RETURN QUERY
+  SELECT
+    e.id,
+    e.resource_id,
+    e.chunk_index,
+    e.chunk_text,
+    1 - (e.embedding <=> query_embedding) AS similarity,
+    e.metadata,
+    r.title AS resource_title,
+    r.url AS resource_url
+  FROM lr_embeddings e
+  JOIN lr_resources r ON r.id = e.resource_id
+  WHERE
+    (filter_resource_ids IS NULL OR e.resource_id = ANY(filter_resource_ids))
+    AND 1 - (e.embedding <=> query_embedding) > match_threshold
+  ORDER BY e.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
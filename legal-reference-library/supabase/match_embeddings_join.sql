@@ -0,0 +1,47 @@
+-- =============================================
+-- MATCH_EMBEDDINGS: JOIN RESOURCE METADATA
+-- =============================================
+-- Return resource title/url directly from the RPC so callers no longer
+-- need a second lr_resources lookup to hydrate search results.
+
+-- Return type changes, so the old signature must be dropped first
+DROP FUNCTION IF EXISTS match_embeddings(vector(1536), float, int, uuid[]);
+
+CREATE FUNCTION match_embeddings(
+  query_embedding vector(1536),
+  match_threshold float DEFAULT 0.7,
+  match_count int DEFAULT 10,
+  filter_resource_ids uuid[] DEFAULT NULL
+)
+RETURNS TABLE (
+  id uuid,
+  resource_id uuid,
+  chunk_index int,
+  chunk_text text,
+  similarity float,
+  metadata jsonb,
+  resource_title text,
+  resource_url text
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+  RETURN QUERY
+  SELECT
+    e.id,
+    e.resource_id,
+    e.chunk_index,
+    e.chunk_text,
+    1 - (e.embedding <=> query_embedding) AS similarity,
+    e.metadata,
+    r.title AS resource_title,
+    r.url AS resource_url
+  FROM lr_embeddings e
+  JOIN lr_resources r ON r.id = e.resource_id
+  WHERE
+    (filter_resource_ids IS NULL OR e.resource_id = ANY(filter_resource_ids))
+    AND 1 - (e.embedding <=> query_embedding) > match_threshold
+  ORDER BY e.embedding <=> query_embedding
+  LIMIT match_count;
+END;
+$$;
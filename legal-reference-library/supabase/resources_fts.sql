@@ -0,0 +1,17 @@
+-- =============================================
+-- RESOURCE FULL-TEXT SEARCH
+-- =============================================
+-- The resources list endpoint used to search with two ILIKE patterns
+-- (title/description), which sequential-scans lr_resources on every
+-- query. This adds a stored tsvector column with a GIN index so the
+-- API can use PostgREST's text search operators instead.
+
+ALTER TABLE lr_resources
+  ADD COLUMN IF NOT EXISTS fts tsvector
+  GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(description, '')), 'B')
+  ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_lr_resources_fts
+  ON lr_resources USING GIN (fts);